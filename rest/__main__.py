@@ -0,0 +1,19 @@
+"""Serve the REST API with one uvicorn worker per core, using uvloop and httptools.
+
+Run with `python -m rest`. Set WEB_CONCURRENCY to override the number of workers.
+"""
+import os
+
+import uvicorn
+
+if __name__ == "__main__":
+    workers = int(os.environ.setdefault("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    uvicorn.run(
+        "rest.app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
@@ -1,9 +1,10 @@
 """The agent module defines the LLM agent that handles communicating with the user."""
 
-import json
-from typing import List, Union
+import asyncio
+from typing import List, Optional, Union
 
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
 from openai.types.chat import (
     ChatCompletionMessage,  # When the agent returns a message
     ChatCompletionMessageToolCall,  # When the agent returns a tool call
@@ -11,6 +12,7 @@ from openai.types.chat import (
     ChatCompletionSystemMessageParam,  # The system message model
     ChatCompletionUserMessageParam,  # The user message model
     ChatCompletionAssistantMessageParam,
+    ChatCompletionMessageParam,
 )
 
 from .prompts import SYSTEM_PROMPT
@@ -18,26 +20,52 @@ from .tools import tools, Event, execute_tool
 from .types import AgentMessage, ErrorMessage
 
 from ..graph import graph_itinerary
-from ..redis import redis_client
+from ..openai import openai_client
+from ..redis import RedisClient, get_redis_client
+
+# The system message is identical for every session, so it is only built once.
+SYSTEM_MSG = ChatCompletionSystemMessageParam(role="system", content=SYSTEM_PROMPT)
+
+
+def _to_message_param(
+    message: ChatCompletionMessage,
+) -> ChatCompletionAssistantMessageParam:
+    """Convert a message returned by the LLM into a plain assistant message param.
+
+    The OpenAI client re-serializes every pydantic model in the history on each request,
+    so messages are converted to plain dicts once, when they are received.
+    """
+    data = message.model_dump(exclude_none=True)
+    data.setdefault("content", None)
+    return ChatCompletionAssistantMessageParam(**data)
 
 
 class Agent:
     """The Agent class is responsible for executing the agent."""
 
-    messages: List[
-        Union[
-            ChatCompletionMessage,
-            ChatCompletionMessageToolCall,
-        ]
-    ]
+    messages: List[ChatCompletionMessageParam]
 
     def __init__(
         self,
         user_id: str,
         session_id: str,
         model: str = "gpt-3.5-turbo-1106",
+        llm_client: AsyncOpenAI = openai_client,
+        chat_store: Optional[RedisClient] = None,
     ):
-        """Setup the agent object."""
+        """Setup the agent object.
+
+        The agent only holds the state of a single request. The LLM and Redis clients
+        are shared singletons, so constructing an agent does not open any connections.
+
+        Args:
+            user_id (str): The ID of the user the agent is interacting with.
+            session_id (str): The ID of the chat session.
+            model (str): The LLM model to use.
+            llm_client (AsyncOpenAI): The shared OpenAI client.
+            chat_store (RedisClient): The shared Redis client storing the chat history.
+                Defaults to the client returned by `get_redis_client`.
+        """
 
         # The ID of the user that the agent is interacting with. This will be used for querying
         # the Graph Database.
@@ -46,42 +74,37 @@ class Agent:
 
         self._tools = tools
 
-        # Establish the message history if it exists, otherwise create a new message history.
-        self._load_chat_history()
+        # The message history is loaded when the agent is called, since it requires I/O.
+        self.messages = []
+        self._last_events = None
+        self._itinerary: Optional[str] = None
 
         self.model = model
-        self.client = OpenAI()
+        self.client = llm_client
+        self._chat_store = chat_store if chat_store is not None else get_redis_client()
         self._finish_reason = None
 
-    @property
-    def itinerary(self):
-        """Return the itinerary of the user. This must be fetched from the Graph Database."""
-        itinerary = graph_itinerary.get_itinerary(self._user_id)
-        return itinerary.context
+    async def get_itinerary(self) -> str:
+        """Return the itinerary of the user. This must be fetched from the Graph Database.
+
+        The itinerary does not change while the agent is running, so it is only fetched
+        once per agent.
+        """
+        if self._itinerary is None:
+            itinerary = await graph_itinerary.get_itinerary(self._user_id)
+            self._itinerary = itinerary.context
+        return self._itinerary
 
     @property
     def last_events(self) -> Union[List[Event], None]:
-        """Return the last events."""
-        # iterate backwards through self.messages until we find a message of role "tool",
-        # with name "event_creator"
-        for message in reversed(self.messages):
-            # Extract the role and name from the message. We are looking for messages
-            # returned from the LLM, so we filter out all dict instances
-            if isinstance(message, dict):
-                role = message.get("role", "")
-                name = message.get("name", "")
-                if role == "tool" and name == "event_creator":
-                    data = json.loads(message.get("content", ""))
-                    events = [Event(**item) for item in data]
-                    return events
-
-        return None
+        """Return the events created by the latest call to the event creator tool."""
+        return self._last_events
 
-    def _load_chat_history(self) -> None:
+    async def _load_chat_history(self) -> None:
         """Load the chat history from the Redis endpoint."""
         # Establish the message history if it exists, otherwise create a new message history.
         chat_history = (
-            redis_client.get_chat_history(self._session_id)
+            await asyncio.to_thread(self._chat_store.get_chat_history, self._session_id)
             if self._session_id
             else None
         )
@@ -94,31 +117,54 @@ class Agent:
                         del msg["tool_calls"]
                     chat_history[i] = ChatCompletionAssistantMessageParam(**msg)
             self.messages = chat_history
+            self._last_events = self._find_last_events()
         else:
             self.messages = [
-                ChatCompletionSystemMessageParam(role="system", content=SYSTEM_PROMPT),
-                ChatCompletionUserMessageParam(role="user", content=self.itinerary),
+                SYSTEM_MSG,
+                ChatCompletionUserMessageParam(
+                    role="user", content=await self.get_itinerary()
+                ),
             ]
+            self._last_events = None
 
-    def __call__(self, query: str) -> Union[AgentMessage, ErrorMessage]:
+    def _find_last_events(self) -> Union[List[Event], None]:
+        """Find the events created by the last event creator call in the history.
+
+        This is only needed once, when the history is loaded. Afterwards the events are
+        kept up to date by `_execute_tool`.
+        """
+        # iterate backwards through self.messages until we find a message of role "tool",
+        # with name "event_creator"
+        for message in reversed(self.messages):
+            # Extract the role and name from the message. We are looking for messages
+            # returned from the LLM, so we filter out all dict instances
+            if isinstance(message, dict):
+                role = message.get("role", "")
+                name = message.get("name", "")
+                if role == "tool" and name == "event_creator":
+                    data = orjson.loads(message.get("content", ""))
+                    events = [Event(**item) for item in data]
+                    return events
+
+        return None
+
+    async def __call__(self, query: str) -> Union[AgentMessage, ErrorMessage]:
         """Execute the agent."""
+        # Establish the message history if it exists, otherwise create a new message history.
+        await self._load_chat_history()
         self.messages.append(ChatCompletionUserMessageParam(role="user", content=query))
 
         try:
             count = 0
             while count < 5:
-                # Execute a single step of the agent.
-                self._step()
-
-                # Get the last message from the agent (the result of the last step)
-                last_message = self.messages[-1]
+                # Execute a single step of the agent, and get the message it returned.
+                last_message = await self._step()
 
                 print("last message: ", last_message)
                 # If the last message is a tool_call, execute the tool call.
                 if (
-                    isinstance(last_message, ChatCompletionMessage)
-                    and self._finish_reason == "tool_calls"
-                    and len(last_message.tool_calls) > 0  # pylint: disable=no-member
+                    self._finish_reason == "tool_calls"
+                    and last_message.tool_calls  # pylint: disable=no-member
                 ):
                     tool_calls = last_message.tool_calls  # pylint: disable=no-member
 
@@ -129,7 +175,7 @@ class Agent:
 
                     # Get the tool call
                     tool_call = tool_calls[0]  # pylint: disable=unsubscriptable-object
-                    self._execute_tool(tool_call)
+                    await self._execute_tool(tool_call)
 
                 # Otherwise, if the last message has content, then we may return the results.
                 if self._finish_reason == "stop":
@@ -141,7 +187,9 @@ class Agent:
             agent_response = AgentMessage(
                 content=last_message.content, events=self.last_events
             )
-            redis_client.update_chat_history(self._session_id, self.messages)
+            await asyncio.to_thread(
+                self._chat_store.update_chat_history, self._session_id, self.messages
+            )
             return agent_response
         except Exception as exp:  # pylint: disable=broad-except
             print(exp)
@@ -150,13 +198,17 @@ class Agent:
             )
             return error_message
 
-    def delete(self) -> None:
+    async def delete(self) -> None:
         """Delete the chat history from the Redis endpoint."""
-        redis_client.delete_chat_history(self._session_id)
+        await asyncio.to_thread(self._chat_store.delete_chat_history, self._session_id)
+
+    async def _step(self) -> ChatCompletionMessage:
+        """Execute a single step of the agent.
 
-    def _step(self) -> None:
-        """Execute a single step of the agent."""
-        completion = self.client.chat.completions.create(
+        Returns:
+            ChatCompletionMessage: The message returned by the LLM.
+        """
+        completion = await self.client.chat.completions.create(
             model=self.model,
             messages=self.messages,
             tools=self._tools,
@@ -165,12 +217,21 @@ class Agent:
         )
         msg = completion.choices[0].message
         self._finish_reason = completion.choices[0].finish_reason
-        self.messages.append(msg)
+        self.messages.append(_to_message_param(msg))
+        return msg
 
-    def _execute_tool(self, tool_call_message: ChatCompletionMessageToolCall) -> None:
+    async def _execute_tool(
+        self, tool_call_message: ChatCompletionMessageToolCall
+    ) -> None:
         """Execute a tool call."""
         tool_call_id = tool_call_message.id
         tool_name = tool_call_message.function.name
-        tool_args = json.loads(tool_call_message.function.arguments)
-        tool_result = execute_tool(tool_call_id, tool_name, **tool_args)
-        self.messages.append(tool_result)
+        tool_args = orjson.loads(tool_call_message.function.arguments)
+        tool_message, tool_result = await execute_tool(
+            tool_call_id, tool_name, **tool_args
+        )
+        self.messages.append(tool_message)
+
+        # Keep the created events, so they don't have to be parsed back out of the history.
+        if tool_name == "event_creator":
+            self._last_events = tool_result
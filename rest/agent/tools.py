@@ -1,16 +1,23 @@
 """The tools.py file defines the tools that are used by the agent."""
-import json
-from typing import List, Optional
+import asyncio
+import hashlib
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
+import numpy as np
 from pinecone import ScoredVector
-from pydantic import BaseModel
-from openai import OpenAI
+from pydantic import BaseModel, SerializeAsAny, TypeAdapter
 from openai.types.chat import ChatCompletionMessageToolCallParam
 
 from .types import ActivityType
+from ..cache import cache_client
+from ..graph import graph_venue
 from ..models import City, Event as BaseEventModel
-from ..pinecone import pinecone_index
+from ..openai import openai_client
+from ..pinecone import get_pinecone_index
+
+EMBEDDING_CACHE_TTL = 60 * 60 * 24
+VENUE_CACHE_TTL = 60 * 60
 
 
 class VenueInformation(BaseModel):
@@ -27,6 +34,13 @@ class VenueResult(VenueInformation):
     relevance_score: float
 
 
+# Validates cached venue results from their JSON, and serializes them, in a single pass
+_VENUE_RESULTS_ADAPTER = TypeAdapter(List[VenueResult])
+
+# Serializes the objects returned by any tool with the fields of their own class
+_TOOL_RESULTS_ADAPTER = TypeAdapter(List[SerializeAsAny[BaseModel]])
+
+
 class Event(BaseEventModel):
     """Event object that represents an event from the API. We override the base model
     to implement additional functionality needed by the Agent.
@@ -36,27 +50,34 @@ class Event(BaseEventModel):
     venue_id: Optional[str] = None
 
     @classmethod
-    def from_venues(
+    async def from_venues(
         cls, venues: List[VenueInformation], start_time: str, end_time: str
     ) -> List["Event"]:
         """Create an event from a venue."""
-        # Get the urls and thumbnail urls for the venues from the Graph
-        # TODO: Implement this query to the graph
+        # Get the urls and thumbnail urls for all the venues from the Graph in one query
+        details = await graph_venue.get_venues([venue.id for venue in venues])
 
         print(venues)
         # Create an list of Event object to be returned to the client
-        return [
-            cls(
-                id=str(uuid4()),
-                title=venue.name,
-                venue_id=venue.id,
-                start_time=start_time,
-                end_time=end_time,
-                url="http://business-name.com/",
-                thumbnail_url="http://business-name.com/image.jpg",
+        events = []
+        for venue in venues:
+            detail = details.get(venue.id)
+            events.append(
+                cls(
+                    id=str(uuid4()),
+                    title=venue.name,
+                    venue_id=venue.id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    url=detail.url if detail else "http://business-name.com/",
+                    thumbnail_url=(
+                        detail.thumbnail_url
+                        if detail
+                        else "http://business-name.com/image.jpg"
+                    ),
+                )
             )
-            for venue in venues
-        ]
+        return events
 
 
 class VenueQueryTool(BaseModel):
@@ -68,22 +89,46 @@ class VenueQueryTool(BaseModel):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._openai_client = OpenAI()
-        self._index = pinecone_index
+        self._openai_client = openai_client
+        self._index = get_pinecone_index()
+
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed a query using the OpenAI API.
+
+        Embeddings are cached in Redis under the SHA-256 of the query, so identical
+        queries only hit the OpenAI API once per day.
+        """
+        key = "emb:" + hashlib.sha256(query.encode("utf-8")).hexdigest()
+        cached = await cache_client.get(key)
+        if cached is not None:
+            return np.frombuffer(cached, dtype=np.float32).tolist()
 
-    def _embed_query(self, query: str) -> List[float]:
-        """Embed a query using the OpenAI API."""
         # Get the embeddings of the query.
-        response = self._openai_client.embeddings.create(
+        response = await self._openai_client.embeddings.create(
             input=query, model="text-embedding-ada-002"
         )
-        return response.data[0].embedding
+        embedding = response.data[0].embedding
+        await cache_client.set(
+            key, np.asarray(embedding, dtype=np.float32).tobytes(), EMBEDDING_CACHE_TTL
+        )
+        return embedding
+
+    def _cache_key(self, query_value: List[float]) -> str:
+        """Build the Redis key for the venues matching a query embedding.
 
-    def _query_vectorstore(self) -> List[ScoredVector]:
+        The results of the query only depend on the city, the category, and the embedding
+        of the query, so those are hashed together.
+        """
+        digest = hashlib.sha256(f"{self.city.value}|{self.category.value}|".encode())
+        digest.update(np.asarray(query_value, dtype=np.float32).tobytes())
+        return "venues:" + digest.hexdigest()
+
+    async def _query_vectorstore(self, query_value: List[float]) -> List[ScoredVector]:
         """Query the Vectorstore database."""
-        # Get a list of relevant venues from the Vectorstore database.
-        query_value = self._embed_query(self.query)
-        venue_results = self._index.query(
+        # Get a list of relevant venues from the Vectorstore database. The Pinecone client
+        # is blocking, so the query is run in a worker thread to keep the event loop free.
+        venue_results = await asyncio.to_thread(
+            self._index.query,
             vector=query_value,
             top_k=10,
             namespace="venues",
@@ -101,11 +146,18 @@ class VenueQueryTool(BaseModel):
 
         return venue_results["matches"]
 
-    def __call__(self) -> List[VenueResult]:
+    async def __call__(self) -> List[VenueResult]:
         """Execute the VenueQueryTool."""
+        query_value = await self._embed_query(self.query)
+
+        # Serve the venues from the cache if the same query was made recently.
+        key = self._cache_key(query_value)
+        cached = await cache_client.get(key)
+        if cached is not None:
+            return _VENUE_RESULTS_ADAPTER.validate_json(cached)
 
         # Get a list of relevant venues from the Vectorstore database.
-        filtered_venues = self._query_vectorstore()
+        filtered_venues = await self._query_vectorstore(query_value)
 
         # Now that we have base venues, we need to order them based on the relationship values
         # between the venues and the user's posts
@@ -117,6 +169,9 @@ class VenueQueryTool(BaseModel):
             VenueResult(id=venue.id, **venue.metadata, relevance_score=venue.score)
             for venue in filtered_venues
         ]
+        await cache_client.set(
+            key, _VENUE_RESULTS_ADAPTER.dump_json(results), VENUE_CACHE_TTL
+        )
         return results
 
     @staticmethod
@@ -152,11 +207,11 @@ class EventCreatorTool(BaseModel):
     start_time: str
     end_time: str
 
-    def __call__(self) -> List[Event]:
+    async def __call__(self) -> List[Event]:
         """Execute the EventCreatorTool."""
         # We simply create an event for each venue.
 
-        events = Event.from_venues(self.venues, self.start_time, self.end_time)
+        events = await Event.from_venues(self.venues, self.start_time, self.end_time)
 
         return events
 
@@ -184,20 +239,31 @@ class EventCreatorTool(BaseModel):
         }
 
 
-def execute_tool(_id: str, name: str, **kwargs) -> ChatCompletionMessageToolCallParam:
-    """Execute a tool given a name and a set of arguments."""
+async def execute_tool(
+    _id: str, name: str, **kwargs
+) -> Tuple[ChatCompletionMessageToolCallParam, List[BaseModel]]:
+    """Execute a tool given a name and a set of arguments.
+
+    Returns:
+        Tuple[ChatCompletionMessageToolCallParam, List[BaseModel]]: The tool message to be
+            sent to the LLM, and the objects returned by the tool.
+    """
     if name == "venue_query":
         tool = VenueQueryTool(**kwargs)
     elif name == "event_creator":
         tool = EventCreatorTool(**kwargs)
     else:
         raise ValueError(f"Invalid tool name: {name}.")
-    result = tool()
-    data = [item.model_dump() for item in result]
-    print(data)
-    return ChatCompletionMessageToolCallParam(
-        tool_call_id=_id, role="tool", name=name, content=json.dumps(data)
+    result = await tool()
+    # The items are encoded straight to JSON, rather than dumped to dicts and re-encoded.
+    content = _TOOL_RESULTS_ADAPTER.dump_json(result).decode()
+    print(content)
+    message = ChatCompletionMessageToolCallParam(
+        tool_call_id=_id, role="tool", name=name, content=content
     )
+    return message, result
 
 
-tools = [VenueQueryTool.definition(), EventCreatorTool.definition()]
+# The tool definitions (and the JSON schemas they embed) are built once at import and
+# shared by every agent. They are kept in a tuple so they cannot be modified in place.
+tools = (VenueQueryTool.definition(), EventCreatorTool.definition())
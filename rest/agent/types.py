@@ -1,5 +1,4 @@
 """This file defines different Enum types and pydantic models that are used in the Agent module."""
-import json
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -43,11 +42,9 @@ class ActivityType(Enum):
 class Message(BaseModel):
     """A message sent by the user or agent."""
 
-    def model_dump(self, **kwargs):  # pylint: disable=unused-argument
-        """Dump the model to a dictionary."""
-        json_data = self.model_dump_json()
-        data = json.loads(json_data)
-        return data
+    def model_dump(self, **kwargs):
+        """Dump the model to a JSON compatible dictionary."""
+        return super().model_dump(mode="json", **kwargs)
 
 
 class AgentMessage(Message):
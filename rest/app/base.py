@@ -2,38 +2,89 @@
 some basic configuration settings that will be used elsewhere in the module.
 """
 import os
+from contextlib import asynccontextmanager
 
-from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from openai import AsyncOpenAI
 from pydantic import BaseModel
-from starlette.responses import JSONResponse
 
-from ..bert import BertClassifier
-from ..config import logger, settings
+from ..bert import BatchedBertClassifier, BertClassifier
+from ..cache import cache_client
+from ..clerk import ClerkClient
+from ..openai import openai_client
+from ..redis import RedisClient, get_redis_client
+from ..config import logger, get_settings
+from ..graph import close_driver
+from ..models import DomainValidationError
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """Create the clients shared by every request, and close them on shutdown.
+
+    The OpenAI and cache clients are module-level singletons, created at import and
+    used directly by other modules, so neither is closed here; a later lifespan in the
+    same process (e.g. under the reloader) would otherwise get a closed client. Their
+    connections are released when the process exits.
+    """
+    application.state.clerk = ClerkClient()
+    application.state.llm_client = openai_client
+    application.state.chat_store = get_redis_client()
+    yield
+    await application.state.clerk.close()
+    await close_driver()
+    await BATCHED_MODEL.close()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+
+def get_clerk(request: Request) -> ClerkClient:
+    """Get the shared ClerkClient, for use as a route dependency."""
+    return request.app.state.clerk
+
+
+def get_llm_client(request: Request) -> AsyncOpenAI:
+    """Get the shared OpenAI client, for use as a route dependency."""
+    return request.app.state.llm_client
+
+
+def get_chat_store(request: Request) -> RedisClient:
+    """Get the shared Redis client storing chat histories, as a route dependency."""
+    return request.app.state.chat_store
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(_request: Request, _exc: RequestValidationError):
     """Handle validation exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": "Invalid request. Please check the documentation."},
     )
 
 
+@app.exception_handler(DomainValidationError)
+async def domain_exception_handler(_request: Request, exc: DomainValidationError):
+    """Handle requests that violate the rules of the domain models."""
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(Exception)
+async def internal_exception_handler(_request: Request, exc: Exception):
+    """Handle any unexpected exception raised by a route."""
+    logger.error(exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
 logger.info("API is starting up")
 
-# Load environment variables
-ENV_LOADED = load_dotenv(".env")
-logger.info("Loaded environment variables: %s", ENV_LOADED)
-logger.info("Settings: %s", settings)
+logger.info("Settings: %s", get_settings())
 
 # Load model
 MODEL = BertClassifier(f"{os.getcwd()}/checkpoints/bert-social.model")
+BATCHED_MODEL = BatchedBertClassifier(MODEL)
 
 
 class PredictPayload(BaseModel):
@@ -46,5 +97,13 @@ class PredictPayload(BaseModel):
 @app.post("/predict")
 async def predict(item: PredictPayload):
     """Predict the personas for a given text."""
-    prediction = MODEL.classify(item.text)
-    return JSONResponse(content=prediction)
+    # Concurrent requests are batched into a single forward pass, which runs off the
+    # event loop.
+    prediction = await BATCHED_MODEL.classify(item.text)
+    return ORJSONResponse(content=prediction)
+
+
+@app.get("/meta/cache-stats")
+async def cache_stats():
+    """Get the hit rate of the Redis cache lookups served by this worker."""
+    return cache_client.stats()
@@ -1,10 +1,12 @@
 """Board API endpoints."""
+import asyncio
+
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
-from .base import app, MODEL
+from .base import BATCHED_MODEL, app
 
-from ..config import logger
 from ..graph import graph_board
 from ..models import ClassifiedSocialMediaPost, SocialMediaPostPersonas
 from ..tiktok import TikTokClient, TikTokClientError
@@ -44,28 +46,25 @@ async def route__get_boards(user_id: str = None):
         user_id (str): The user ID for which to get the posts.
 
     Returns:
-        JSONResponse (200): The response for the request.
+        ORJSONResponse (200): The response for the request.
 
     Raises:
-        JSONResponse (400): If the user ID is not provided.
-        JSONResponse (500): If there is an internal server error.
+        ORJSONResponse (400): If the user ID is not provided.
+        ORJSONResponse (500): If there is an internal server error.
     """
-    try:
-        # Assert the the user ID is provided.
-        if not user_id:
-            return JSONResponse(
-                status_code=400, content={"detail": "User ID is required"}
-            )
-
-        result = graph_board.get_board(user_id)
-        json_result = [post.model_dump() for post in result]
-        return JSONResponse(status_code=200, content=json_result)
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse(
-            status_code=500, content={"detail": "Internal Server Error"}
+    # Assert the the user ID is provided.
+    if not user_id:
+        return ORJSONResponse(
+            status_code=400, content={"detail": "User ID is required"}
         )
 
+    board = await graph_board.get_board_json(user_id)
+    return Response(
+        content=board,
+        status_code=200,
+        media_type="application/json",
+    )
+
 
 @app.put("/board")
 async def route__update_board(payload: HTTPMoodBoardPUTRequest):
@@ -79,17 +78,21 @@ async def route__update_board(payload: HTTPMoodBoardPUTRequest):
         payload (HTTPMoodBoardPUTRequest): The payload for the request.
 
     Returns:
-        JSONResponse (200): The response for the request.
+        ORJSONResponse (200): The response for the request.
 
     Raises:
-        JSONResponse (400): If the TikTok post is invalid.
+        ORJSONResponse (400): If the TikTok post is invalid.
     """
     try:
-        # Setup TikTok client to hit o_embed endpoint for video data
-        video_metadata = TikTokClient.get_oembed(payload.author_name, payload.video_id)
+        # Setup TikTok client to hit o_embed endpoint for video data. The client is
+        # blocking, so it runs in a thread to keep the event loop free.
+        video_metadata = await asyncio.to_thread(
+            TikTokClient.get_oembed, payload.author_name, payload.video_id
+        )
 
-        # Run the post caption through the inference model
-        prediction = MODEL.classify(video_metadata.caption)
+        # Run the post caption through the inference model, batched with any other
+        # concurrent classifications
+        prediction = await BATCHED_MODEL.classify(video_metadata.caption)
 
         # Create ClassifiedSocialMediaPost object
         classified_post = ClassifiedSocialMediaPost(
@@ -103,10 +106,10 @@ async def route__update_board(payload: HTTPMoodBoardPUTRequest):
         )
 
         # Create a post in the database
-        post_created = graph_board.create_post(classified_post)
+        post_created = await graph_board.create_post(classified_post)
 
         # Return the count of posts created by the query (either 0 or 1)
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "post_created_count": post_created,
                 "post": classified_post.post.model_dump(),
@@ -114,12 +117,9 @@ async def route__update_board(payload: HTTPMoodBoardPUTRequest):
             status_code=200,
         )
     except TikTokClientError:
-        return JSONResponse(
+        return ORJSONResponse(
             {"detail": "The provided TikTok post is invalid."}, status_code=400
         )
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse({"detail": "Internal Server Error"}, status_code=500)
 
 
 @app.delete("/board")
@@ -130,27 +130,20 @@ async def route__delete_board(payload: HTTPMoodBoardDELETERequest):
         payload (HTTPMoodBoardDELETERequest): The payload for the request.
 
     Returns:
-        JSONResponse (200): The response for the request.
+        ORJSONResponse (200): The response for the request.
 
     Raises:
-        JSONResponse (404): If the post is not found.
+        ORJSONResponse (404): If the post is not found.
     """
-    try:
-        # Delete a post from the database
-        post_deleted = graph_board.delete_post(payload.user_id, payload.video_id)
-
-        if post_deleted == 0:
-            return JSONResponse(
-                status_code=404,
-                content={"detail": "Post not found"},
-            )
-        # Return the count of posts deleted by the query (should be 1, if count is greater
-        # than 1 if there are multiple posts with the same video ID for a user -- this would
-        # be a bug if this occurs)
-        return {"post_deleted_count": post_deleted}
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "Internal Server Error"},
+    # Delete a post from the database
+    post_deleted = await graph_board.delete_post(payload.user_id, payload.video_id)
+
+    if post_deleted == 0:
+        return ORJSONResponse(
+            status_code=404,
+            content={"detail": "Post not found"},
         )
+    # Return the count of posts deleted by the query (should be 1, if count is greater
+    # than 1 if there are multiple posts with the same video ID for a user -- this would
+    # be a bug if this occurs)
+    return {"post_deleted_count": post_deleted}
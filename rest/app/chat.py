@@ -1,12 +1,14 @@
 """The chat.py file defines the routes for utilizing the chat resource."""
 from uuid import uuid4
 
+from fastapi import Depends
+from fastapi.responses import ORJSONResponse, Response
+from openai import AsyncOpenAI
 from pydantic import BaseModel
-from starlette.responses import JSONResponse
 
-from .base import app
+from .base import app, get_chat_store, get_llm_client
 from ..agent import Agent
-from ..config import logger
+from ..redis import RedisClient
 
 
 class HTTPChatPOSTRequest(BaseModel):
@@ -43,70 +45,63 @@ class HTTPChatDeleteRequest(BaseModel):
 async def route__post_chat(_payload: HTTPChatPOSTRequest):
     """Create a new chat session."""
 
-    try:
-        _id = str(uuid4())
+    _id = str(uuid4())
 
-        return JSONResponse(status_code=200, content={"chat_id": _id})
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "Internal server error"},
-        )
+    return ORJSONResponse(status_code=200, content={"chat_id": _id})
 
 
 @app.put("/chat")
-async def route__put_chat(payload: HTTPChatPUTRequest):
+async def route__put_chat(
+    payload: HTTPChatPUTRequest,
+    llm_client: AsyncOpenAI = Depends(get_llm_client),
+    chat_store: RedisClient = Depends(get_chat_store),
+):
     """Send a message to the agent.
 
     Args:
         payload (HTTPChatPUTRequest): The request payload.
 
     Returns:
-        JSONResponse (200): The response for the request.
+        ORJSONResponse (200): The response for the request.
 
     Raises:
-        JSONResponse (400): If the chat ID is not provided.
-        JSONResponse (500): If there is an internal server error.
+        ORJSONResponse (400): If the chat ID is not provided.
+        ORJSONResponse (500): If there is an internal server error.
     """
-    try:
-        # Get the chat session from Redis with the Chat ID
-        # message_history = redis_client.get(payload.chat_id)
+    # Get the chat session from Redis with the Chat ID
+    # message_history = redis_client.get(payload.chat_id)
 
-        agent = Agent(
-            payload.user_id,
-            payload.chat_id,
-        )
-        response = agent(payload.content)
+    agent = Agent(
+        payload.user_id,
+        payload.chat_id,
+        llm_client=llm_client,
+        chat_store=chat_store,
+    )
+    response = await agent(payload.content)
 
-        # Return the response
-        return JSONResponse(status_code=200, content=response.model_dump())
-
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error(e)
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "An internal server error occurred"},
-        )
+    # Return the response
+    return Response(
+        content=response.model_dump_json(),
+        status_code=200,
+        media_type="application/json",
+    )
 
 
 @app.delete("/chat")
-async def route__delete_chat(payload: HTTPChatDeleteRequest):
+async def route__delete_chat(
+    payload: HTTPChatDeleteRequest,
+    llm_client: AsyncOpenAI = Depends(get_llm_client),
+    chat_store: RedisClient = Depends(get_chat_store),
+):
     """Delete a chat session."""
 
-    try:
-        agent = Agent(
-            payload.user_id,
-            payload.chat_id,
-        )
-
-        agent.delete()
+    agent = Agent(
+        payload.user_id,
+        payload.chat_id,
+        llm_client=llm_client,
+        chat_store=chat_store,
+    )
 
-        return JSONResponse(status_code=200, content={"detail": "Chat session deleted"})
+    await agent.delete()
 
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "Internal server error"},
-        )
+    return ORJSONResponse(status_code=200, content={"detail": "Chat session deleted"})
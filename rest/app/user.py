@@ -11,16 +11,22 @@ to authenticate requests through a JWT that encodes the user ID. This would allo
 us to scope the resources based on the user ID in the JWT, rather than having to
 pass it around in the request payloads.
 """
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+import orjson
+from fastapi import Depends
+from pydantic import BaseModel, TypeAdapter
 
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
-from .base import app
+from .base import app, get_clerk
 
 from ..config import logger
 from ..clerk import ClerkClient, ClerkClientError, ClerkUserDoesNotExist
+from ..models import User
+
+# Serializes lists of users straight to JSON bytes in a single pass.
+USER_LIST_ADAPTER = TypeAdapter(List[User])
 
 
 class HTTPUserPOSTRequest(BaseModel):
@@ -54,80 +60,74 @@ class HTTPUserDELETERequest(BaseModel):
 
 
 @app.post("/user")
-async def route__create_user(payload: HTTPUserPOSTRequest):
+async def route__create_user(
+    payload: HTTPUserPOSTRequest, clerk: ClerkClient = Depends(get_clerk)
+):
     """Create a new user in the database."""
 
-    clerk = ClerkClient()
-
     try:
-        user = clerk.create_user(
+        user = await clerk.create_user(
             email=payload.email,
             first_name=payload.first_name,
             last_name=payload.last_name,
             password=payload.password,
         )
-        return JSONResponse(status_code=200, content=user.model_dump())
+        return Response(
+            content=user.model_dump_json(),
+            status_code=200,
+            media_type="application/json",
+        )
 
     except ClerkClientError as exp:
         logger.error(exp)
-        return JSONResponse(status_code=400, content={"detail": exp.message})
-
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse(
-            status_code=500, content={"detail": "Internal Server Error"}
-        )
+        return ORJSONResponse(status_code=400, content={"detail": exp.message})
 
 
 @app.get("/user")
-async def route__get_users(user_id: Optional[str] = None):
+async def route__get_users(
+    user_id: Optional[str] = None, clerk: ClerkClient = Depends(get_clerk)
+):
     """Get all users in the database.
 
     Optionally, the client can provide a `user_id` query param to
     filter for a specific user.
     """
-    clerk = ClerkClient()
     try:
         if user_id:
-            user = clerk.get_user(user_id)
+            # Cached users are embedded in the response as the stored JSON
+            user = await clerk.get_user_json(user_id)
             if user is None:
-                return JSONResponse(status_code=200, content=[])
-            return JSONResponse(status_code=200, content=[user.model_dump()])
-
-        users = clerk.list_users()
-        return JSONResponse(
-            status_code=200, content=[user.model_dump() for user in users]
+                return ORJSONResponse(status_code=200, content=[])
+            return Response(
+                content=orjson.dumps([orjson.Fragment(user)]),
+                status_code=200,
+                media_type="application/json",
+            )
+
+        users = await clerk.list_users()
+        return Response(
+            content=USER_LIST_ADAPTER.dump_json(users),
+            status_code=200,
+            media_type="application/json",
         )
     except ClerkClientError as exp:
         logger.error(exp)
-        return JSONResponse(status_code=400, content={"detail": exp.message})
-
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse(
-            status_code=500, content={"detail": "Internal Server Error"}
-        )
+        return ORJSONResponse(status_code=400, content={"detail": exp.message})
 
 
 @app.delete("/user")
-async def route__delete_user(payload: HTTPUserDELETERequest):
+async def route__delete_user(
+    payload: HTTPUserDELETERequest, clerk: ClerkClient = Depends(get_clerk)
+):
     """Delete a user from the database."""
-    clerk = ClerkClient()
-
     try:
-        clerk.delete_user(payload.user_id)
-        return JSONResponse(status_code=200, content={})
+        await clerk.delete_user(payload.user_id)
+        return ORJSONResponse(status_code=200, content={})
 
     except ClerkClientError as exp:
         logger.error(exp)
-        return JSONResponse(status_code=400, content={"detail": exp.message})
+        return ORJSONResponse(status_code=400, content={"detail": exp.message})
 
     except ClerkUserDoesNotExist as exp:
         logger.error(exp)
-        return JSONResponse(status_code=400, content={"detail": exp.message})
-
-    except Exception as exp:  # pylint: disable=broad-except
-        logger.error(exp)
-        return JSONResponse(
-            status_code=500, content={"detail": "Internal Server Error"}
-        )
+        return ORJSONResponse(status_code=400, content={"detail": exp.message})
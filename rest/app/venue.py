@@ -1,9 +1,8 @@
 """Venue API Endpoints."""
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from .base import app
 
-from ..config import logger
 from ..graph import graph_venue
 
 
@@ -21,27 +20,21 @@ async def route__get_venues(venue_id: str = None):
         venue_id (str): The venue ID for which to get the venues.
 
     Returns:
-        JSONResponse (200): The response for the request.
+        ORJSONResponse (200): The response for the request.
 
     Raises:
-        JSONResponse (500): If there is an internal server error.
+        ORJSONResponse (500): If there is an internal server error.
     """
-    try:
-        # Assert the the venue ID is provided.
-        if not venue_id:
-            return JSONResponse(
-                status_code=400, content={"detail": "Venue ID is required"}
-            )
-
-        # Get the venue from the database.
-        venue = graph_venue.get_venue(venue_id)
-
-        if not venue:
-            return JSONResponse(status_code=404, content={"detail": "Venue not found"})
-
-        return JSONResponse(content=venue.model_dump(), status_code=200)
-    except Exception as e:  # pylint: disable=broad-except
-        logger.exception(e)
-        return JSONResponse(
-            status_code=500, content={"detail": "Internal server error"}
+    # Assert the the venue ID is provided.
+    if not venue_id:
+        return ORJSONResponse(
+            status_code=400, content={"detail": "Venue ID is required"}
         )
+
+    # Get the venue from the database. Cached venues are served as the stored JSON.
+    venue = await graph_venue.get_venue_json(venue_id)
+
+    if not venue:
+        return ORJSONResponse(status_code=404, content={"detail": "Venue not found"})
+
+    return Response(content=venue, status_code=200, media_type="application/json")
@@ -1,9 +1,18 @@
 """This file handles classifying social media posts."""
-from typing import Dict
+import asyncio
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import Dict, List, Optional, Tuple
 
 import torch
 from torch.nn import functional as F
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+from transformers import (
+    AutoConfig,
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+)
 
 KEYWORDS = [
     "socialButterfly",
@@ -17,7 +26,7 @@ KEYWORDS = [
 ]
 
 
-class BertClassifier:  # pylint: disable=too-few-public-methods
+class BertClassifier:
     """We want to make predictions that return the classification scores for all personas."""
 
     def __init__(self, model_path: str) -> None:
@@ -25,14 +34,26 @@ class BertClassifier:  # pylint: disable=too-few-public-methods
 
         self.tokenizer = AutoTokenizer.from_pretrained(bert_ckpt)
 
-        # Load the model from the state dict
-        self.model = AutoModelForSequenceClassification.from_pretrained(
+        # Load the model from the state dict. The architecture is built from the config
+        # alone, since the pretrained weights would be overwritten by the checkpoint.
+        config = AutoConfig.from_pretrained(
             bert_ckpt,
             num_labels=len(KEYWORDS),
             problem_type="multi_label_classification",
         )
-        self.model.load_state_dict(torch.load(model_path))
+        self.model = AutoModelForSequenceClassification.from_config(config)
+        self.model.load_state_dict(torch.load(model_path, map_location="cpu"))
         self.model.config.id2label = KEYWORDS
+        self.model.eval()
+
+        # Inference runs on CPU, where int8 matmuls are much faster than fp32 ones
+        self.model = torch.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+        # Split the cores between the server workers instead of oversubscribing them
+        workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
 
     def classify(self, sequence: str) -> Dict[str, float]:
         """Classify a sequence of text.
@@ -54,3 +75,150 @@ class BertClassifier:  # pylint: disable=too-few-public-methods
             zip(self.model.config.id2label, probabilities.squeeze(0).tolist())
         )
         return classes
+
+    def classify_batch(self, sequences: List[str]) -> List[Dict[str, float]]:
+        """Classify a batch of sequences of text in a single forward pass.
+
+        Args:
+            sequences (List[str]): The sequences of text to classify.
+
+        Returns:
+            List[Dict[str, float]]: The classification scores for each persona, in the
+                same order as the sequences.
+        """
+        inputs = self.tokenizer(
+            sequences,
+            padding=True,
+            truncation=True,
+            max_length=512,
+            return_tensors="pt",
+        )
+        with torch.no_grad():
+            logits = self.model(**inputs).logits
+        probabilities = F.sigmoid(logits)
+
+        return [
+            dict(zip(self.model.config.id2label, row))
+            for row in probabilities.tolist()
+        ]
+
+
+class BatchedBertClassifier:  # pylint: disable=too-few-public-methods
+    """Collects concurrent classification requests into micro-batches.
+
+    Requests are queued and a background task drains up to `max_batch_size` of them, or
+    whatever arrived within `max_wait` seconds of the first one, before running a single
+    forward pass for the whole batch.
+
+    The classifier is deterministic, so the scores of the last `cache_size` distinct
+    sequences are kept, and repeated sequences skip the model entirely.
+    """
+
+    def __init__(
+        self,
+        classifier: BertClassifier,
+        max_batch_size: int = 32,
+        max_wait: float = 0.005,
+        cache_size: int = 4096,
+    ) -> None:
+        self._classifier = classifier
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # Forward passes always run on the same dedicated thread, so they never
+        # compete with each other or with the threads of the default executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def classify(self, sequence: str) -> Dict[str, float]:
+        """Classify a sequence of text as part of the next batch.
+
+        Args:
+            sequence (str): The sequence of text to classify.
+
+        Returns:
+            Dict[str, float]: The classification scores for each persona.
+        """
+        cached = self._cache.get(sequence)
+        if cached is not None:
+            self._cache.move_to_end(sequence)
+            return dict(cached)
+
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="bert"
+                )
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((sequence, future))
+        return dict(await future)
+
+    async def close(self) -> None:
+        """Stop the batching task and shut down the inference thread.
+
+        Both are started again by the next classification, so the batcher can be
+        reused after it is closed.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        if self._executor is not None:
+            # A forward pass that is already running finishes in the background
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _remember(self, sequence: str, result: Dict[str, float]) -> None:
+        """Cache the scores of a sequence, evicting the least recently used ones."""
+        self._cache[sequence] = result
+        self._cache.move_to_end(sequence)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for the first request, then gather more until the batch is full or the
+        batching window closes.
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._max_wait
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Classify batches of queued requests until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            sequences = [sequence for sequence, _ in batch]
+            try:
+                # The forward pass is CPU bound, so it runs off the event loop.
+                results = await loop.run_in_executor(
+                    self._executor, self._classifier.classify_batch, sequences
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (sequence, future), result in zip(batch, results):
+                self._remember(sequence, result)
+                if not future.done():
+                    future.set_result(result)
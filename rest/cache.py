@@ -0,0 +1,95 @@
+"""The cache.py file defines an asynchronous Redis client used to cache read-mostly
+resources, such as Clerk users and venues from the graph database.
+"""
+from typing import Dict, Union
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .config import get_settings, logger
+
+
+class CacheClient:
+    """The CacheClient class is responsible for caching serialized resources in Redis.
+
+    The cache is never the source of truth, so Redis errors are logged and swallowed:
+    a failed lookup is treated as a miss and a failed write or invalidation as a
+    no-op, letting the callers fall through to the underlying resource.
+    """
+
+    def __init__(self):
+        """Setup the connection pool to the Redis endpoint."""
+        self._url = get_settings().REDIS_ENDPOINT
+        self._client = Redis.from_url(
+            self._url, max_connections=100, socket_timeout=5.0
+        )
+
+        # Lookups served by this process, for monitoring the hit rate
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    async def get(self, key: str) -> Union[bytes, None]:
+        """Get a cached value.
+
+        Args:
+            key: The key of the cached value.
+
+        Returns:
+            The serialized value, or None if the key is missing or expired, or if the
+            lookup failed.
+        """
+        try:
+            value = await self._client.get(key)
+        except RedisError as e:
+            self._errors += 1
+            logger.warning(f"Cache lookup for {key} failed: {e}")
+            value = None
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+
+    async def set(self, key: str, value: Union[bytes, str], ttl: int) -> None:
+        """Cache a value.
+
+        Args:
+            key: The key to store the value under.
+            value: The serialized value to store.
+            ttl: The number of seconds after which the value expires.
+        """
+        try:
+            await self._client.set(key, value, ex=ttl)
+        except RedisError as e:
+            self._errors += 1
+            logger.warning(f"Cache write for {key} failed: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        """Invalidate cached values.
+
+        Args:
+            keys: The keys of the values to invalidate.
+        """
+        try:
+            await self._client.delete(*keys)
+        except RedisError as e:
+            self._errors += 1
+            logger.warning(f"Cache invalidation for {', '.join(keys)} failed: {e}")
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get the hit, miss and error counts of the operations served by this process.
+
+        Returns:
+            The number of hits, misses and Redis errors, and the hit rate.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "errors": self._errors,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+
+cache_client = CacheClient()
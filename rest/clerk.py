@@ -3,14 +3,15 @@
 This client has methods for creating, getting, deleting, and listing the users in the
 application.
 """
-import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-import requests
+import httpx
+import orjson
 
-from requests import Response
+from httpx import Response
 
-from .config import settings
+from .cache import cache_client
+from .config import get_settings
 from .models import User
 
 
@@ -19,7 +20,7 @@ class ClerkClientError(Exception):
 
     def __init__(self, response: Response) -> None:
         """Initialize the ClerkClientError."""
-        payload = response.json()
+        payload = orjson.loads(response.content)
         self.errors = [error.get("message", None) for error in payload["errors"]]
 
     def __str__(self) -> str:
@@ -49,18 +50,36 @@ class ClerkUserDoesNotExist(Exception):
         return f"User with id {self.user_id} does not exist."
 
 
+USER_CACHE_TTL = 60 * 5
+
+
 class ClerkClient:
     """The ClerkClient class defines a client for the Clerk REST API."""
 
     def __init__(self):
-        self._secret_key = settings.CLERK_SECRET_KEY
+        self._secret_key = get_settings().CLERK_SECRET_KEY
         self._base = "https://api.clerk.com/v1"
+        self._headers = self._build_headers()
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=5,
+        )
+        self._dispatch = {
+            "GET": self._client.get,
+            "POST": self._client.post,
+            "DELETE": self._client.delete,
+        }
 
-    @property
-    def headers(self):
-        """The default headers for the ClerkClient.
+    async def close(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
 
-        This property handles setting the Authorization header with the secret key.
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the default headers for the ClerkClient.
+
+        This handles setting the Authorization header with the secret key. The headers
+        never change, so they are built once and sent with every request by the client.
         """
         headers = {}
 
@@ -69,7 +88,7 @@ class ClerkClient:
         headers["Content-Type"] = "application/json"
         return headers
 
-    def _execute(
+    async def _execute(
         self,
         method: str,
         endpoint: str,
@@ -77,30 +96,18 @@ class ClerkClient:
         search_params: Optional[Dict[str, Any]] = None,
     ) -> Response:
         """Execute a request to the Clerk API."""
-        params = (
-            "?" + "&".join([f"{k}={v}" for k, v in search_params.items()])
-            if search_params
-            else ""
-        )
+        # The search params are URL-encoded by httpx.
         url = f"{self._base}/{endpoint}"
-        if params:
-            url += params
-
-        match method:
-            case "GET":
-                return requests.get(url, headers=self.headers, timeout=5)
-            case "POST":
-                return requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=5
-                )
-            case "DELETE":
-                return requests.delete(
-                    url, headers=self.headers, data=payload, timeout=5
-                )
-            case _:
-                raise ValueError(f"Unsupported method: {method}")
-
-    def create_user(
+
+        request = self._dispatch.get(method)
+        if request is None:
+            raise ValueError(f"Unsupported method: {method}")
+
+        if payload is None:
+            return await request(url, params=search_params)
+        return await request(url, content=orjson.dumps(payload), params=search_params)
+
+    async def create_user(
         self, email: str, first_name: str, last_name: str, password: str
     ) -> User:
         """Create a user in Clerk."""
@@ -112,66 +119,96 @@ class ClerkClient:
             "password": password,
         }
 
-        response = self._execute("POST", "users", payload=payload)
+        response = await self._execute("POST", "users", payload=payload)
 
         # Catch error responses from clerk
         if response.status_code in [400, 422]:
             raise ClerkClientError(response)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Transform the data here:
-            user = User(**data)
+            user = User.from_clerk(data)
             return user
 
         raise ValueError("Unexpected response from Clerk API.")
 
-    def list_users(self) -> List[User]:
+    async def list_users(self) -> List[User]:
         """List all users in Clerk."""
         search_params = {"limit": 100}
-        response = self._execute("GET", "users", search_params=search_params)
+        response = await self._execute("GET", "users", search_params=search_params)
 
         # Catch error responses from clerk
         if response.status_code in [400, 422]:
             raise ClerkClientError(response)
 
         if response.status_code == 200:
-            data = response.json()
-            return [User(**user) for user in data]
+            data = orjson.loads(response.content)
+            return [User.from_clerk(user) for user in data]
 
         raise ValueError("Unexpected response from Clerk API.")
 
-    def get_user(self, user_id: str) -> Optional[User]:
-        """Get a specific clerk user."""
-
+    async def _fetch_user(self, user_id: str) -> Optional[User]:
+        """Get a specific clerk user from the Clerk API, and cache its JSON in Redis."""
         search_params = {"user_id": user_id}
 
-        response = self._execute("GET", "users", search_params=search_params)
+        response = await self._execute("GET", "users", search_params=search_params)
 
         # Catch error responses from clerk
         if response.status_code in [400, 422]:
             raise ClerkClientError(response)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if len(data) == 0:
                 return None
 
-            return User(**data[0])
+            user = User.from_clerk(data[0])
+            await cache_client.set(
+                f"user:{user_id}", user.model_dump_json(), USER_CACHE_TTL
+            )
+            return user
 
         raise ValueError("Unexpected response from Clerk API.")
 
-    def delete_user(self, user_id: str) -> None:
+    async def get_user(self, user_id: str) -> Optional[User]:
+        """Get a specific clerk user.
+
+        Users are cached in Redis for a few minutes. The cached JSON is a dump of the
+        User's own fields, which are all strings, so it is loaded with model_construct.
+        It cannot go through model_validate_json, which would call the constructor that
+        expects a Clerk user object.
+        """
+        cached = await cache_client.get(f"user:{user_id}")
+        if cached is not None:
+            return User.model_construct(**orjson.loads(cached))
+
+        return await self._fetch_user(user_id)
+
+    async def get_user_json(self, user_id: str) -> Optional[Union[bytes, str]]:
+        """Get a specific clerk user as JSON.
+
+        On a cache hit the cached JSON is returned as is, without building the model.
+        """
+        cached = await cache_client.get(f"user:{user_id}")
+        if cached is not None:
+            return cached
+
+        user = await self._fetch_user(user_id)
+        return None if user is None else user.model_dump_json()
+
+    async def delete_user(self, user_id: str) -> None:
         """Delete a user from clerk."""
 
-        response = self._execute("DELETE", f"users/{user_id}")
+        response = await self._execute("DELETE", f"users/{user_id}")
 
         # Catch error responses from clerk
         if response.status_code in [400, 422]:
             raise ClerkClientError(response)
 
         if response.status_code == 200:
+            await cache_client.delete(f"user:{user_id}")
             return
 
         if response.status_code == 404:
@@ -2,16 +2,24 @@
 import os
 import sys
 import logging
+from functools import lru_cache
+from typing import Optional
 
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Setup the logger to be used throughout the application
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
-logger.addHandler(logging.StreamHandler(sys.stdout))
 
-load_dotenv(".env")
+# Guard against attaching a second handler (and emitting every line twice) when the
+# module is re-imported, e.g. by the reloader.
+if not logger.handlers:
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+# In production the environment is provided by the deployment, not a .env file.
+if os.getenv("ENV") != "production":
+    load_dotenv(".env")
 
 
 class Settings(BaseSettings):
@@ -27,21 +35,35 @@ class Settings(BaseSettings):
         PINECONE_API_KEY: The API key for Pinecone.
         PINECONE_ENVIRONMENT: The environment for Pinecone.
         PINECONE_INDEX: The index for Pinecone.
+
+        REDIS_ENDPOINT: The URL for the Redis endpoint.
     """
 
+    # The values are read from the environment when the settings are instantiated,
+    # rather than when the class is defined. Outside production the environment has
+    # already been populated from .env above, which also covers the variables read by
+    # other clients (e.g. OPENAI_API_KEY), so .env is not read a second time here.
+    model_config = SettingsConfigDict(extra="ignore")
+
     # Neo4J Database Settings
-    NEO4J_DATABASE_USERNAME: str = os.getenv("NEO4J_DATABASE_USERNAME")
-    NEO4J_DATABASE_URL: str = os.getenv("NEO4J_DATABASE_URL")
-    NEO4J_DATABASE_PASSWORD: str = os.getenv("NEO4J_DATABASE_PASSWORD")
+    NEO4J_DATABASE_USERNAME: Optional[str] = None
+    NEO4J_DATABASE_URL: Optional[str] = None
+    NEO4J_DATABASE_PASSWORD: Optional[str] = None
 
-    CLERK_SECRET_KEY: str = os.getenv("CLERK_SECRET_KEY")
+    CLERK_SECRET_KEY: Optional[str] = None
 
-    PINECONE_API_KEY: str = os.getenv("PINECONE_API_KEY")
-    PINECONE_ENVIRONMENT: str = os.getenv("PINECONE_ENVIRONMENT")
-    PINECONE_INDEX: str = os.getenv("PINECONE_INDEX")
+    PINECONE_API_KEY: Optional[str] = None
+    PINECONE_ENVIRONMENT: Optional[str] = None
+    PINECONE_INDEX: Optional[str] = None
 
-    REDIS_ENDPOINT: str = os.getenv("REDIS_ENDPOINT")
+    REDIS_ENDPOINT: Optional[str] = None
 
 
-# Initialize this module's settings when the file is first defined
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, which are only loaded once.
+
+    Returns:
+        Settings: The application settings.
+    """
+    return Settings()
@@ -3,3 +3,4 @@ from . import board as graph_board
 from . import event as graph_event
 from . import itinerary as graph_itinerary
 from . import venue as graph_venue
+from .driver import close_driver
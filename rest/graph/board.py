@@ -1,22 +1,52 @@
 """This file defines the graph queries for the Social Media Post resource."""
 from typing import List
 
+from pydantic import TypeAdapter
+
 from .driver import get_driver
+from ..cache import cache_client
 from ..models import ClassifiedSocialMediaPost, SocialMediaPost
 
+BOARD_CACHE_TTL = 60
+
+# Serializes a whole board to JSON in a single pass
+_BOARD_ADAPTER = TypeAdapter(List[SocialMediaPost])
+
+# The personas are passed as a list parameter and merged in a single UNWIND, so the
+# query text never changes and Neo4j reuses the cached query plan.
+CREATE_POST_CYPHER = (
+    "MERGE (p: Post {userId: $user_id, videoId: $video_id}) "
+    "ON CREATE SET p.authorName = $author_name, p.postUrl = $post_url, "
+    "p.thumbnailUrl = $thumbnail_url, p.embedCode = $embed_code "
+    "ON MATCH SET p.thumbnailUrl = $thumbnail_url, p.embedCode = $embed_code "
+    "WITH p "
+    "UNWIND $personas AS persona "
+    "MERGE (pz:Persona {value: persona.name}) "
+    "MERGE (p)-[r:PERSONA_RELEVANCE]->(pz) "
+    "SET r.weight = persona.weight "
+    "RETURN DISTINCT p"
+)
+
 
-def get_board(user_id: str) -> List[SocialMediaPost]:
-    """Get all posts for a user. This consitutes the mood board for the user.
+async def get_board_json(user_id: str) -> bytes:
+    """Get all posts for a user as JSON. This consitutes the mood board for the user.
 
     Args:
         user_id (str): The user ID for which to get the posts.
 
     Returns:
-        List[SocialMediaPost]: The list of posts for the user.
+        bytes: The JSON list of posts for the user.
     """
+    # Boards are read far more often than they change, so their JSON is cached in Redis
+    # and served as is, and invalidated whenever a post is added or removed.
+    key = f"board:{user_id}"
+    cached = await cache_client.get(key)
+    if cached is not None:
+        return cached
+
     driver = get_driver()
-    with driver.session() as session:
-        result = session.run(
+    async with driver.session() as session:
+        result = await session.run(
             "MATCH (p:Post) WHERE p.userId = $user_id "
             "RETURN p.postUrl AS post_url, "
             "p.authorName AS author_name, "
@@ -26,11 +56,16 @@ def get_board(user_id: str) -> List[SocialMediaPost]:
             "p.thumbnailUrl AS thumbnail_url",
             user_id=user_id,
         )
-        records = result.data()
-        return [SocialMediaPost(**record) for record in records]
+        records = await result.data()
+        board = _BOARD_ADAPTER.dump_json(
+            [SocialMediaPost(**record) for record in records]
+        )
+
+    await cache_client.set(key, board, BOARD_CACHE_TTL)
+    return board
 
 
-def create_post(_post: ClassifiedSocialMediaPost) -> int:
+async def create_post(_post: ClassifiedSocialMediaPost) -> int:
     """Create a post in the database.
 
     Args:
@@ -39,38 +74,29 @@ def create_post(_post: ClassifiedSocialMediaPost) -> int:
     Returns:
         int: The number of posts created.
     """
+    params = {
+        "user_id": _post.user_id,
+        "video_id": _post.video_id,
+        "author_name": _post.author_name,
+        "post_url": _post.post_url,
+        "thumbnail_url": _post.thumbnail_url,
+        "embed_code": _post.embed_code,
+        "personas": [
+            {"name": persona, "weight": score}
+            for persona, score in _post.classifications.model_dump().items()
+        ],
+    }
+
     driver = get_driver()
-    merges = ""
-    weights = ""
-    for i, kv_pair in enumerate(_post.classifications.model_dump().items()):
-        persona, score = kv_pair
-        merges += f"MERGE (p{i}:Persona {{ value : '{persona}' }}) "
-        weights += (
-            f"MERGE (p)-[r{i}:PERSONA_RELEVANCE]->(p{i}) SET r{i}.weight = {score} "
-        )
-    relational_cypher = "\n".join([merges, weights])
-    with driver.session() as session:
-        result = session.run(
-            "MERGE (p: Post {userId: $user_id, videoId: $video_id}) "
-            "ON CREATE SET p.authorName = $author_name, p.postUrl = $post_url, "
-            "p.thumbnailUrl = $thumbnail_url, p.embedCode = $embed_code "
-            "ON MATCH SET p.thumbnailUrl = $thumbnail_url, p.embedCode = $embed_code "
-            f"{relational_cypher} "
-            "RETURN p",
-            {
-                "user_id": _post.user_id,
-                "video_id": _post.video_id,
-                "author_name": _post.author_name,
-                "post_url": _post.post_url,
-                "thumbnail_url": _post.thumbnail_url,
-                "embed_code": _post.embed_code,
-            },
-        )
-        summary = result.consume()
-        return summary.counters.nodes_created
+    async with driver.session() as session:
+        result = await session.run(CREATE_POST_CYPHER, params)
+        summary = await result.consume()
+
+    await cache_client.delete(f"board:{_post.user_id}")
+    return summary.counters.nodes_created
 
 
-def delete_post(user_id: str, video_id: str) -> int:
+async def delete_post(user_id: str, video_id: str) -> int:
     """Delete a post from the database.
 
     Args:
@@ -81,8 +107,8 @@ def delete_post(user_id: str, video_id: str) -> int:
         int: The number of posts deleted.
     """
     driver = get_driver()
-    with driver.session() as session:
-        result = session.run(
+    async with driver.session() as session:
+        result = await session.run(
             "MATCH (p:Post) WHERE p.userId = $user_id AND p.videoId = $video_id "
             "DETACH DELETE p",
             {
@@ -90,5 +116,7 @@ def delete_post(user_id: str, video_id: str) -> int:
                 "video_id": video_id,
             },
         )
-        summary = result.consume()
-        return summary.counters.nodes_deleted
+        summary = await result.consume()
+
+    await cache_client.delete(f"board:{user_id}")
+    return summary.counters.nodes_deleted
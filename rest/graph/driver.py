@@ -1,25 +1,38 @@
 """This file defines a simple helper function to get a driver for the Neo4J database."""
+from typing import Optional
 
-from neo4j import GraphDatabase, Driver
+from neo4j import AsyncGraphDatabase, AsyncDriver
 
-from ..config import settings
+from ..config import get_settings
 
 
-DB_USER = settings.NEO4J_DATABASE_USERNAME
-DB_URL = settings.NEO4J_DATABASE_URL
-DB_PASSWORD = settings.NEO4J_DATABASE_PASSWORD
+_driver: Optional[AsyncDriver] = None
 
 
-def get_driver() -> Driver:
-    """Get a driver for the Neo4J database.
+def get_driver() -> AsyncDriver:
+    """Get the driver for the Neo4J database.
+
+    The driver owns the connection pool, so it is created once and shared by all queries.
 
     Returns:
-        neo4j.Driver: The driver for the Neo4J database.
+        neo4j.AsyncDriver: The driver for the Neo4J database.
     """
-    return GraphDatabase.driver(
-        DB_URL,
-        auth=(DB_USER, DB_PASSWORD),
-        connection_acquisition_timeout=2,
-        max_connection_pool_size=50,
-        max_connection_lifetime=600,
-    )
+    global _driver  # pylint: disable=global-statement
+    if _driver is None:
+        settings = get_settings()
+        _driver = AsyncGraphDatabase.driver(
+            settings.NEO4J_DATABASE_URL,
+            auth=(settings.NEO4J_DATABASE_USERNAME, settings.NEO4J_DATABASE_PASSWORD),
+            connection_acquisition_timeout=2,
+            max_connection_pool_size=50,
+            max_connection_lifetime=600,
+        )
+    return _driver
+
+
+async def close_driver() -> None:
+    """Close the shared driver and its connection pool, if it was ever created."""
+    global _driver  # pylint: disable=global-statement
+    if _driver is not None:
+        await _driver.close()
+        _driver = None
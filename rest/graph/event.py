@@ -5,12 +5,12 @@ from .driver import get_driver
 from ..models import Event
 
 
-def create_event(event: Event, user_id: str) -> bool:
+async def create_event(event: Event, user_id: str) -> bool:
     """Create an event in the database."""
     driver = get_driver()
 
-    with driver.session() as session:
-        session.run(
+    async with driver.session() as session:
+        await session.run(
             "MATCH (v: Venue {id: $venue_id}) "  # Find the venue with the given ID
             "MATCH (i: Itinerary {userId: $user_id}) "  # Find the user's itinerary
             "CREATE (e: Event {id: $id, startTime: $start_time, endTime: $end_time, \
@@ -33,7 +33,7 @@ def create_event(event: Event, user_id: str) -> bool:
         return None
 
 
-def update_event(event_id: str, start: datetime, end: datetime) -> bool:
+async def update_event(event_id: str, start: datetime, end: datetime) -> bool:
     """Update the start and end times of an event.
 
     Args:
@@ -46,8 +46,8 @@ def update_event(event_id: str, start: datetime, end: datetime) -> bool:
     """
     driver = get_driver()
 
-    with driver.session() as session:
-        result = session.run(
+    async with driver.session() as session:
+        result = await session.run(
             "MATCH (e: Event {id: $event_id}) "
             "SET e.startTime = $start, e.endTime = $end "
             "RETURN e",
@@ -58,12 +58,12 @@ def update_event(event_id: str, start: datetime, end: datetime) -> bool:
             },
         )
 
-        summary = result.consume()
+        summary = await result.consume()
         updated_props = summary.counters.properties_set
         return updated_props > 0
 
 
-def delete_event(event_id: str) -> bool:
+async def delete_event(event_id: str) -> bool:
     """Delete an event from the database.
 
     Args:
@@ -75,14 +75,14 @@ def delete_event(event_id: str) -> bool:
 
     driver = get_driver()
 
-    with driver.session() as session:
-        result = session.run(
+    async with driver.session() as session:
+        result = await session.run(
             "MATCH (e: Event {id: $event_id}) DETACH DELETE e",
             {
                 "event_id": event_id,
             },
         )
 
-        summary = result.consume()
+        summary = await result.consume()
         deleted_nodes = summary.counters.nodes_deleted
         return deleted_nodes > 0
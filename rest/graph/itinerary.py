@@ -1,69 +1,102 @@
 """The itinerary.py file defines the Neo4J queries for fetching itineraries."""
+from datetime import date, datetime
 from typing import Union
 
+from neo4j import AsyncManagedTransaction
+
 from .driver import get_driver
-from ..models import Itinerary, Event
+from ..models import City, Itinerary, Event
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse a datetime formatted by the itinerary query.
+
+    Neo4J's `toString` returns ISO-8601, omitting the seconds when they are zero, and
+    appends the zone ID (e.g. `[America/New_York]`) for datetimes stored with one. The
+    offset already pins the instant, so the zone ID is dropped.
+
+    Args:
+        value (str): The ISO-8601 datetime returned by the graph database.
+
+    Returns:
+        datetime: The timezone aware datetime.
+    """
+    return datetime.fromisoformat(value.split("[", 1)[0])
 
 
-def get_itinerary(user_id: str) -> Union[Itinerary, None]:
+async def get_itinerary(user_id: str) -> Union[Itinerary, None]:
     """Get an itinerary for a user.
 
     Args:
         user_id (str): The user ID.
 
     Returns:
-        Itinerary: The itinerary for the user.
+        Union[Itinerary, None]: The itinerary for the user, or None if the user has no
+            itinerary.
     """
-    try:
-        driver = get_driver()
-        with driver.session() as session:
-            result = session.run(
-                "MATCH (n: Itinerary) "
-                "WHERE n.userId = $user_id "
-                "OPTIONAL MATCH (n)-[:HAS_EVENT]->(e:Event)-[:AT]->(v:Venue) "
-                "RETURN n, collect({ "
-                "id: e.id, "
-                "title: e.title, "
-                "venueId: v.id, "
-                "url: e.url, "
-                "thumbnailUrl: e.thumbnailUrl, "
-                "startTime: apoc.date.format(e.startTime.epochMillis, 'ms', "
-                "'yyyy-MM-dd\\'T\\'HH:mm:ss.SSSZ'), "
-                "endTime: apoc.date.format(e.endTime.epochMillis, 'ms', "
-                "'yyyy-MM-dd\\'T\\'HH:mm:ss.SSSZ') "
-                "}) as events",
-                {
-                    "user_id": user_id,
-                },
-            )
 
-            record = result.single()
-            itinerary_record = record["n"]
-
-            # Check if the first event is None
-            if record["events"][0]["id"] is None:
-                events = []
-            else:
-                events = [
-                    Event(
-                        id=event["id"],
-                        title=event["title"],
-                        venue_id=event["venueId"],
-                        start_time=event["startTime"],
-                        end_time=event["endTime"],
-                        url=event["url"],
-                        thumbnail_url=event["thumbnailUrl"],
-                    )
-                    for event in record["events"]
-                ]
-
-            itinerary = Itinerary(events=events, **itinerary_record)
-            return itinerary
-    except TypeError:
+    async def _read(tx: AsyncManagedTransaction):
+        result = await tx.run(
+            "MATCH (n: Itinerary) "
+            "WHERE n.userId = $user_id "
+            "OPTIONAL MATCH (n)-[:HAS_EVENT]->(e:Event)-[:AT]->(v:Venue) "
+            "WITH n, e, v ORDER BY e.startTime "
+            "RETURN n, collect({ "
+            "id: e.id, "
+            "title: e.title, "
+            "venueId: v.id, "
+            "url: e.url, "
+            "thumbnailUrl: e.thumbnailUrl, "
+            "startTime: toString(e.startTime), "
+            "endTime: toString(e.endTime) "
+            "}) as events",
+            {
+                "user_id": user_id,
+            },
+        )
+        return await result.single()
+
+    # A managed read transaction is retried on transient errors and can be routed to
+    # a read replica.
+    driver = get_driver()
+    async with driver.session() as session:
+        record = await session.execute_read(_read)
+
+    if record is None:
         return None
 
+    itinerary_record = record["n"]
+
+    # Check if the first event is None
+    if record["events"][0]["id"] is None:
+        events = []
+    else:
+        # The records come from the graph, whose schema is enforced by the query, so the
+        # models are constructed without running validation. The query returns the
+        # events sorted by start time, as the itinerary expects.
+        events = [
+            Event.from_trusted(
+                id=event["id"],
+                title=event["title"],
+                venueId=event["venueId"],
+                startTime=_parse_datetime(event["startTime"]),
+                endTime=_parse_datetime(event["endTime"]),
+                url=event["url"],
+                thumbnailUrl=event["thumbnailUrl"],
+            )
+            for event in record["events"]
+        ]
 
-def create_itinerary(
+    return Itinerary.from_trusted(
+        events=events,
+        city=City(itinerary_record["city"]),
+        userId=itinerary_record["userId"],
+        startDate=date.fromisoformat(itinerary_record["startDate"]),
+        endDate=date.fromisoformat(itinerary_record["endDate"]),
+    )
+
+
+async def create_itinerary(
     itinerary: Itinerary,
 ) -> bool:
     """Create an itinerary for a user.
@@ -80,33 +113,29 @@ def create_itinerary(
     if itinerary.events:
         raise ValueError("Itinerary should not have events")
 
-    driver = get_driver()
-    with driver.session() as session:
-        # Delete existing itinerary and related events
-        result = session.run(
+    async def _create(tx: AsyncManagedTransaction) -> bool:
+        # Replace any existing itinerary, detaching its events, in a single statement
+        result = await tx.run(
             """
-            MATCH (n:Itinerary) WHERE n.userId = $user_id
-            DETACH DELETE n
-            RETURN n
-            """,
-            {"user_id": itinerary.user_id},
-        )
-        record = result.single()
-        itinerary_existed = record is not None
-
-        # Upsert itinerary
-        session.run(
-            """
-            MERGE (n:Itinerary {userId: $user_id})
-            ON CREATE SET n.city = $city, n.startDate = $start_date, n.endDate = $end_date
-            ON MATCH SET n.city = $city, n.startDate = $start_date, n.endDate = $end_date
-            RETURN n
+            OPTIONAL MATCH (n:Itinerary {userId: $user_id})
+            WITH collect(n) AS existing
+            FOREACH (n IN existing | DETACH DELETE n)
+            MERGE (m:Itinerary {userId: $user_id})
+            SET m.city = $city, m.startDate = $start_date, m.endDate = $end_date
+            RETURN size(existing) > 0 AS existed
             """,
             {
                 "user_id": itinerary.user_id,
-                "city": itinerary.city.value,  # Assuming city is an object with a 'name' attribute
+                "city": itinerary.city.value,
                 "start_date": itinerary.start_date.isoformat(),
                 "end_date": itinerary.end_date.isoformat(),
             },
         )
-        return itinerary_existed
+        record = await result.single()
+        return record["existed"]
+
+    # The delete and the upsert are one statement in one transaction, so the itinerary
+    # is never left deleted and only one round trip is made.
+    driver = get_driver()
+    async with driver.session() as session:
+        return await session.execute_write(_create)
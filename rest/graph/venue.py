@@ -1,12 +1,17 @@
 """This file defines the graph queries for the Venue resource."""
-from typing import List, Union
+from typing import Dict, List, Union
+
+from neo4j import AsyncManagedTransaction
 
 from .driver import get_driver
+from ..cache import cache_client
 from ..models import YelpVenue
 
+VENUE_CACHE_TTL = 60 * 60
 
-def get_venue(venue_id: str) -> Union[YelpVenue, None]:
-    """Get a venue from the graph database.
+
+async def _fetch_venue(venue_id: str) -> Union[YelpVenue, None]:
+    """Get a venue from the graph database, and cache its JSON in Redis.
 
     Args:
         venue_id (str): The ID of the venue to get.
@@ -15,22 +20,70 @@ def get_venue(venue_id: str) -> Union[YelpVenue, None]:
         Union[YelpVenue, None]: The venue from the graph database or None
             if it does not exist.
     """
-    try:
-        with get_driver().session() as session:
-            result = session.run(
-                """
-                MATCH (v:Venue {id: $venue_id})
-                RETURN v
-                """,
-                venue_id=venue_id,
-            )
-            venue = result.single()["v"]
-            return YelpVenue(**venue)
-    except TypeError:
+
+    async def _read(tx: AsyncManagedTransaction):
+        result = await tx.run(
+            """
+            MATCH (v:Venue {id: $venue_id})
+            RETURN v
+            """,
+            venue_id=venue_id,
+        )
+        return await result.single()
+
+    async with get_driver().session() as session:
+        record = await session.execute_read(_read)
+
+    if record is None:
         return None
 
+    venue = YelpVenue(**record["v"])
+    await cache_client.set(
+        f"venue:{venue_id}", venue.model_dump_json(), VENUE_CACHE_TTL
+    )
+    return venue
+
+
+async def get_venue(venue_id: str) -> Union[YelpVenue, None]:
+    """Get a venue from the graph database.
+
+    Venues are read-mostly, so they are cached in Redis. A cached venue is validated
+    from its JSON by pydantic-core, which also restores the City enum.
+
+    Args:
+        venue_id (str): The ID of the venue to get.
+
+    Returns:
+        Union[YelpVenue, None]: The venue from the graph database or None
+            if it does not exist.
+    """
+    cached = await cache_client.get(f"venue:{venue_id}")
+    if cached is not None:
+        return YelpVenue.model_validate_json(cached)
+
+    return await _fetch_venue(venue_id)
+
+
+async def get_venue_json(venue_id: str) -> Union[bytes, str, None]:
+    """Get a venue from the graph database as JSON.
+
+    On a cache hit the cached JSON is returned as is, without building the model.
+
+    Args:
+        venue_id (str): The ID of the venue to get.
+
+    Returns:
+        Union[bytes, str, None]: The JSON of the venue or None if it does not exist.
+    """
+    cached = await cache_client.get(f"venue:{venue_id}")
+    if cached is not None:
+        return cached
+
+    venue = await _fetch_venue(venue_id)
+    return None if venue is None else venue.model_dump_json()
+
 
-def get_venue_details(ids: List[str]) -> List[YelpVenue]:
+async def get_venue_details(ids: List[str]) -> List[YelpVenue]:
     """Get the details of a list of venues from the graph database.
 
     Args:
@@ -40,8 +93,8 @@ def get_venue_details(ids: List[str]) -> List[YelpVenue]:
         List[YelpVenue]: The venues from the graph database.
     """
     try:
-        with get_driver().session() as session:
-            result = session.run(
+        async with get_driver().session() as session:
+            result = await session.run(
                 """
                 MATCH (v:Venue)
                 WHERE v.id IN $ids
@@ -49,6 +102,28 @@ def get_venue_details(ids: List[str]) -> List[YelpVenue]:
                 """,
                 ids=ids,
             )
-            return [YelpVenue(**venue["v"]) for venue in result]
+            return [YelpVenue(**venue["v"]) async for venue in result]
     except TypeError:
         return []
+
+
+async def get_venues(ids: List[str]) -> Dict[str, YelpVenue]:
+    """Get a batch of venues from the graph database in a single query.
+
+    Args:
+        ids (List[str]): The IDs of the venues to get.
+
+    Returns:
+        Dict[str, YelpVenue]: The venues that exist in the graph database, keyed by ID.
+    """
+    async with get_driver().session() as session:
+        result = await session.run(
+            """
+            UNWIND $ids AS id
+            MATCH (v:Venue {id: id})
+            RETURN v
+            """,
+            ids=ids,
+        )
+        venues = [YelpVenue(**record["v"]) async for record in result]
+        return {venue.id: venue for venue in venues}
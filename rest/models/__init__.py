@@ -6,6 +6,7 @@ from .board import SocialMediaPost, ClassifiedSocialMediaPost, SocialMediaPostPe
 from .event import Event
 from .itinerary import (
     Itinerary,
+    DomainValidationError,
     InvalidEventTimeError,
     InvalidStartAndEndTimeError,
     CitiesDoNotMatchError,
@@ -2,12 +2,38 @@
 
 It has a few simple convenience methods for converting to and from JSON.
 """
-import json
-import re
+from functools import lru_cache
 
 from pydantic import BaseModel as BaseModelPydantic
 
 
+@lru_cache(maxsize=1024)
+def _camel_to_snake(name: str) -> str:
+    """Convert a string from camel case to snake case.
+
+    The conversion is a single pass over the characters, and the results are cached,
+    since the keys converted are a small, fixed set of field names.
+
+    Args:
+        name (str): The string to convert.
+    """
+    if not name:
+        return name
+
+    out = [name[0].lower()]
+    last = len(name) - 1
+    for i in range(1, len(name)):
+        char = name[i]
+        if char.isupper():
+            prev = name[i - 1]
+            if prev.islower() or prev.isdigit() or (i < last and name[i + 1].islower()):
+                out.append("_")
+            out.append(char.lower())
+        else:
+            out.append(char)
+    return "".join(out)
+
+
 class BaseModel(BaseModelPydantic):
     """The BaseModel class defines the base model for all models in the application."""
 
@@ -18,8 +44,23 @@ class BaseModel(BaseModelPydantic):
         Args:
             name (str): The string to convert.
         """
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+        return _camel_to_snake(name)
+
+    @classmethod
+    def from_trusted(cls, **kwargs):
+        """Construct the model from trusted data, without running validation.
+
+        The keys are converted from camel case to snake case, as they are in the
+        validating constructors. The values must already have the field types, since
+        they are stored as they are.
+
+        Args:
+            **kwargs: The fields of the model, in camel case or snake case.
+
+        Returns:
+            BaseModel: The model.
+        """
+        return cls.model_construct(**{_camel_to_snake(k): v for k, v in kwargs.items()})
 
     def model_dump(self, **kwargs):
         """Dump the model to a dictionary.
@@ -27,6 +68,4 @@ class BaseModel(BaseModelPydantic):
         Returns:
             Dict[str, str]: The model as a dictionary.
         """
-        json_data = self.model_dump_json(**kwargs)
-        data = json.loads(json_data)
-        return data
+        return super().model_dump(mode="json", **kwargs)
@@ -1,7 +1,10 @@
 """The event.py file defines the data models for the Event resource."""
 from datetime import datetime
+from typing import Any
 from uuid import uuid4
 
+from pydantic import ConfigDict, PrivateAttr
+
 from .base import BaseModel
 from .venue import YelpVenue
 
@@ -18,6 +21,8 @@ class Event(BaseModel):
         thumbnail_url (str): The thumbnail URL of the event.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     venue_id: str
     start_time: datetime
@@ -26,32 +31,60 @@ class Event(BaseModel):
     url: str
     thumbnail_url: str
 
+    # POSIX timestamps of the start and end times, computed once per event
+    _start_ts: int = PrivateAttr()
+    _end_ts: int = PrivateAttr()
+
     def __init__(self, convert: bool = True, **kwargs) -> None:
         if convert:
             kwargs = {self._camel_to_snake(k): v for k, v in kwargs.items()}
 
         super().__init__(**kwargs)
 
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the timestamps once the fields are set.
+
+        This also runs for events built with `from_trusted`, since `model_construct`
+        calls it as well.
+        """
+        self._start_ts = int(self.start_time.timestamp())
+        self._end_ts = int(self.end_time.timestamp())
+
+    @property
+    def start_ts(self) -> int:
+        """The start time of the event as a POSIX timestamp, for cheap comparisons."""
+        return self._start_ts
+
+    @property
+    def end_ts(self) -> int:
+        """The end time of the event as a POSIX timestamp, for cheap comparisons."""
+        return self._end_ts
+
     @property
     def context(self) -> str:
         """Return the context of the event to be used by the LLM."""
-        start = self.start_time.strftime("%Y-%m-%d %H:%M")
-        end = self.end_time.strftime("%Y-%m-%d %H:%M")
-        return EVENT_CONTEXT_TEMPLATE.format(title=self.title, start=start, end=end)
+        start = _format_minutes(self.start_time)
+        end = _format_minutes(self.end_time)
+        return f"""
+    {self.title}
+    ----------------------------------------------
+    Start: {start}
+    End: {end}
+"""
 
     @classmethod
     def create_event(
         cls,
-        start_time: str,
-        end_time: str,
+        start_time: datetime,
+        end_time: datetime,
         venue: YelpVenue,
         itinerary: ".itinerary.Itinerary",
     ) -> "Event":
         """Create an event from a start date, end date, venue, and itinerary.
 
         Args:
-            start_time (str): The start date of the event.
-            end_time (str): The end date of the event.
+            start_time (datetime): The start time of the event.
+            end_time (datetime): The end time of the event.
             venue (Venue): The venue of the event.
             itinerary (Itinerary): The itinerary of the event.
 
@@ -83,9 +116,9 @@ class Event(BaseModel):
         )
 
 
-EVENT_CONTEXT_TEMPLATE = """
-    {title}
-    ----------------------------------------------
-    Start: {start}
-    End: {end}
-"""
+def _format_minutes(time: datetime) -> str:
+    """Format a datetime as `YYYY-MM-DD HH:MM`, without going through strftime."""
+    return (
+        f"{time.year:04d}-{time.month:02d}-{time.day:02d} "
+        f"{time.hour:02d}:{time.minute:02d}"
+    )
@@ -1,15 +1,23 @@
 """The itinerary.py file definees the data models for the Itinerary resource."""
+from bisect import bisect_right
 from datetime import date, datetime
 from typing import List, Tuple
 
-from dateutil import parser
+import pytz
+from pydantic import field_validator
 
 from .base import BaseModel
 from .event import Event
 from .venue import City
 
 
-class CitiesDoNotMatchError(Exception):
+class DomainValidationError(Exception):
+    """The DomainValidationError class is the base class for the exceptions raised when a
+    request is valid, but violates the rules of the domain models.
+    """
+
+
+class CitiesDoNotMatchError(DomainValidationError):
     """The EventCreationError class defines the exception raised when an event cannot be created."""
 
     def __init__(self, venue_city: City, itinerary_city: City):
@@ -21,7 +29,7 @@ class CitiesDoNotMatchError(Exception):
             ({self.itinerary_city}) do not match."
 
 
-class InvalidStartAndEndTimeError(Exception):
+class InvalidStartAndEndTimeError(DomainValidationError):
     """The InvalidStartAndEndTimeError class defines the exception raised when an event has an
     invalid start time or end time.
     """
@@ -34,7 +42,7 @@ class InvalidStartAndEndTimeError(Exception):
         return f"Start time ({self.start_time}) is after end time ({self.end_time})."
 
 
-class InvalidEventTimeError(Exception):
+class InvalidEventTimeError(DomainValidationError):
     """The InvalidTimeError class defines the exception raised when an invalid time is used."""
 
     def __init__(
@@ -50,7 +58,7 @@ class InvalidEventTimeError(Exception):
              the range for start date ({self.start_date}) and end date ({self.end_date})."
 
 
-class EventTimeOverlapError(Exception):
+class EventTimeOverlapError(DomainValidationError):
     """The EventTimeOverlapError class defines the exception raised when an event overlaps with
     another event."""
 
@@ -71,7 +79,7 @@ class Itinerary(BaseModel):
     """The Itinerary class defines the data model for an itinerary.
 
     Attributes:
-        events (List[Event]): The events in the itinerary.
+        events (List[Event]): The events in the itinerary, sorted by start time.
         city (City): The city of the itinerary.
         user_id (str): The user ID of the itinerary.
         start_date (date): The start date of the itinerary.
@@ -90,18 +98,33 @@ class Itinerary(BaseModel):
 
         super().__init__(**kwargs)
 
+    @field_validator("events")
+    @classmethod
+    def _sort_events(cls, events: List[Event]) -> List[Event]:
+        """Sort the events by start time, which validate_new_event relies on."""
+        return sorted(events, key=_start_ts)
+
+    @property
+    def _tz(self) -> pytz.BaseTzInfo:
+        """Get the timezone of the itinerary's city."""
+        return City.get_timezone(self.city)
+
     @property
     def context(self) -> str:
         """Get the context of the itinerary to inject into new LLM conversations."""
-        events_str = "\n".join([event.context for event in self.events])
-        start = self.start_date.strftime("%Y-%m-%d")
-        end = self.end_date.strftime("%Y-%m-%d")
-        return ITINERARY_CONTEXT_TEMPLATE.format(
-            city=self.city,
-            start_date=start,
-            end_date=end,
-            events=events_str,
-        )
+        events_str = "\n".join(event.context for event in self.events)
+        start = self.start_date.isoformat()
+        end = self.end_date.isoformat()
+        return f"""
+City: {self.city}
+Start Date: {start}
+End Date: {end}
+------------------------
+
+Events:
+------------------------
+{events_str}
+"""
 
     def pop_event(self, event_id: str) -> Event:
         """Remove an event from the itinerary.
@@ -112,20 +135,22 @@ class Itinerary(BaseModel):
         Returns:
             Event: The event.
         """
-        for event in self.events:
+        for index, event in enumerate(self.events):
             # If we find the matching event
             if event.id == event_id:
-                # Remove it from the itinerary and return it to the caller
-                self.events.remove(event)
-                return event
+                # Remove it from the itinerary by position and return it to the caller
+                return self.events.pop(index)
 
         return None
 
     def make_times_aware(
-        self, start_time: str, end_time: str
+        self, start_time: datetime, end_time: datetime
     ) -> Tuple[datetime, datetime]:
         """Make the start time and end time aware of the itinerary's timezone.
 
+        The times are parsed once, when the request is validated. Naive times are taken
+        to be local to the itinerary's city, and aware times are converted to it.
+
         Args:
             start_time (datetime): The start time.
             end_time (datetime): The end time.
@@ -133,15 +158,14 @@ class Itinerary(BaseModel):
         Returns:
             Tuple[datetime, datetime]: The start time and end time in the itinerary's timezone.
         """
-        naive_start = parser.parse(start_time)
-        naive_end = parser.parse(end_time)
+        tz = self._tz
 
-        tz = City.get_timezone(self.city)
+        def _localize(time: datetime) -> datetime:
+            if time.tzinfo is None:
+                return tz.localize(time)
+            return time.astimezone(tz)
 
-        aware_start = tz.localize(naive_start)
-        aware_end = tz.localize(naive_end)
-
-        return aware_start, aware_end
+        return _localize(start_time), _localize(end_time)
 
     def validate_new_event(
         self, city: City, start_time: datetime, end_time: datetime
@@ -169,33 +193,20 @@ class Itinerary(BaseModel):
                 start_time, end_time, self.start_date, self.end_date
             )
 
-        # For each event currently existing in the itinerary, assert the the new event does
-        # not have interfering start and end times
-        for event in self.events:
-            # Check if the event starts during an existing event
-            if event.start_time <= start_time <= event.end_time:
-                raise EventTimeOverlapError(
-                    event.start_time, event.end_time, event.title
-                )
+        # The overlap checks compare integer timestamps rather than datetimes
+        start_ts = int(start_time.timestamp())
+        end_ts = int(end_time.timestamp())
 
-            # Check if the event ends during an existing event
-            if event.start_time <= end_time <= event.end_time:
+        # Only the events starting no later than the new event ends can overlap it. The
+        # stored events may overlap each other (e.g. one nested inside another), so their
+        # end times are not sorted and every one of those candidates is checked.
+        index = bisect_right(self.events, end_ts, key=_start_ts)
+        for event in self.events[:index]:
+            if event.end_ts >= start_ts:
                 raise EventTimeOverlapError(
                     event.start_time, event.end_time, event.title
                 )
 
-            # Check if the event contains an existing event
-            if start_time <= event.start_time and end_time >= event.end_time:
-                raise EventTimeOverlapError(start_time, end_time, event.title)
-
-
-ITINERARY_CONTEXT_TEMPLATE = """
-City: {city}
-Start Date: {start_date}
-End Date: {end_date}
-------------------------
-
-Events:
-------------------------
-{events}
-"""
+def _start_ts(event: Event) -> int:
+    """Get the start timestamp of an event, the sort key of an itinerary's events."""
+    return event.start_ts
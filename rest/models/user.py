@@ -1,5 +1,7 @@
 """This file defines the data model for the User resource."""
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+from pydantic import ConfigDict
 
 from .base import BaseModel
 
@@ -7,6 +9,8 @@ from .base import BaseModel
 class User(BaseModel):
     """The User class defines the data model for a user."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     email: str
     name: str
@@ -20,15 +24,37 @@ class User(BaseModel):
         # Add kwargs as a catch-all for any other attributes
         **kwargs,  # pylint: disable=unused-argument
     ) -> None:
-        if first_name is None or last_name is None:
-            name = None
-        else:
-            name = f"{first_name} {last_name}"
-
-        if email_addresses is None or len(email_addresses) == 0:
-            email = None
-        else:
-            email = email_addresses[0].get("email_address", None)
-
-        data = {"id": id, "email": email, "name": name}
-        super().__init__(**data)
+        super().__init__(**_clerk_fields(id, email_addresses, first_name, last_name))
+
+    @classmethod
+    def from_clerk(cls, data: Dict[str, Any]) -> "User":
+        """Create a user from a Clerk user object, without running validation.
+
+        Args:
+            data (Dict[str, Any]): The user object returned by the Clerk API.
+
+        Returns:
+            User: The user.
+        """
+        return cls.model_construct(
+            **_clerk_fields(
+                data.get("id"),
+                data.get("email_addresses"),
+                data.get("first_name"),
+                data.get("last_name"),
+            )
+        )
+
+
+def _clerk_fields(
+    user_id: Optional[str],
+    email_addresses: Optional[List[Dict[str, Any]]],
+    first_name: Optional[str],
+    last_name: Optional[str],
+) -> Dict[str, Optional[str]]:
+    """Map the attributes of a Clerk user object to the fields of a User."""
+    name = (
+        None if first_name is None or last_name is None else f"{first_name} {last_name}"
+    )
+    email = email_addresses[0].get("email_address") if email_addresses else None
+    return {"id": user_id, "email": email, "name": name}
@@ -1,9 +1,9 @@
 """The venue.py file defines the data models for the Venue resource."""
-import json
 from enum import Enum
 from typing import Any, Dict
 
 import pytz
+from pydantic import ConfigDict
 
 from .base import BaseModel
 
@@ -45,14 +45,17 @@ class City(Enum):
         Returns:
             pytz.timezone: The timezone of the city.
         """
-        timezones = {
-            City.NYC: "America/New_York",
-            City.LA: "America/Los_Angeles",
-            City.CHICAGO: "America/Chicago",
-            City.SCOTTSDALE: "America/Phoenix",
-            City.MIAMI: "America/New_York",
-        }
-        return pytz.timezone(timezones.get(city, "UTC"))
+        return _CITY_TZ.get(city, pytz.UTC)
+
+
+# The timezones are loaded once, rather than on every call to City.get_timezone
+_CITY_TZ = {
+    City.NYC: pytz.timezone("America/New_York"),
+    City.LA: pytz.timezone("America/Los_Angeles"),
+    City.CHICAGO: pytz.timezone("America/Chicago"),
+    City.SCOTTSDALE: pytz.timezone("America/Phoenix"),
+    City.MIAMI: pytz.timezone("America/New_York"),
+}
 
 
 class YelpVenue(BaseModel):
@@ -67,19 +70,11 @@ class YelpVenue(BaseModel):
         url (str): The URL of the venue.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     city: City
     name: str
     category: str
     thumbnail_url: str
     url: str
-
-    def model_dump(self, **kwargs) -> Dict[str, Any]:
-        """Dump the model to a dictionary.
-
-        Returns:
-            Dict[str, str]: The model as a dictionary.
-        """
-        json_data = super().model_dump_json(**kwargs)
-        data = json.loads(json_data)
-        return data
@@ -0,0 +1,15 @@
+"""The openai module contains the OpenAI client shared by the application.
+
+The openai_client object should be exported from this module for use in other modules, so
+that every request reuses the same pool of keep-alive connections.
+"""
+import httpx
+from openai import AsyncOpenAI
+
+
+openai_client = AsyncOpenAI(
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=90),
+        timeout=60,
+    )
+)
@@ -1,13 +1,22 @@
 """The pinecone module contains the Pinecone client and index.
 
-The pinecone_index object should be exported from this module for use in other modules.
+The get_pinecone_index function should be exported from this module for use in other
+modules. The client is created on first use, so importing the module does not contact
+Pinecone.
 """
-from pinecone import Pinecone
+from functools import lru_cache
 
-from .config import settings
+from pinecone import Index, Pinecone
 
+from .config import get_settings
 
-pinecone_client = Pinecone(
-    api_key=settings.PINECONE_API_KEY, environment=settings.PINECONE_ENVIRONMENT
-)
-pinecone_index = pinecone_client.Index(settings.PINECONE_INDEX)
+
+@lru_cache(maxsize=1)
+def get_pinecone_index() -> Index:
+    """Get the shared Pinecone index, creating the client on first use."""
+    settings = get_settings()
+    pinecone_client = Pinecone(
+        api_key=settings.PINECONE_API_KEY,
+        environment=settings.PINECONE_ENVIRONMENT,
+    )
+    return pinecone_client.Index(settings.PINECONE_INDEX)
@@ -2,12 +2,17 @@
 delete chat conversations.
 """
 
-import json
-from typing import Dict, List, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Union
 
+import orjson
+from pydantic import TypeAdapter
 from redis import Redis
 
-from .config import settings
+from .config import get_settings
+
+# Serializes a whole chat history in one call, including any pydantic messages in it
+_HISTORY_ADAPTER = TypeAdapter(List[Any])
 
 
 class RedisClient:
@@ -15,16 +20,20 @@ class RedisClient:
 
     def __init__(self):
         """Setup the connection to the Redis endpoint."""
-        self._url = settings.REDIS_ENDPOINT
-        self._client = Redis.from_url(self._url, socket_timeout=5.0)
+        self._url = get_settings().REDIS_ENDPOINT
+        self._client = Redis.from_url(
+            self._url,
+            socket_timeout=5.0,
+            socket_keepalive=True,
+            health_check_interval=30,
+            retry_on_timeout=True,
+        )
 
     def get_chat_history(self, chat_id: str) -> Union[List[Dict[str, str]], None]:
         """Get the chat history from the Redis endpoint."""
         chat_history = self._client.get(chat_id)
         if chat_history is not None:
-            data = chat_history.decode("utf-8")
-            message_history = json.loads(data)
-            return message_history
+            return orjson.loads(chat_history)
 
         return None
 
@@ -35,18 +44,14 @@ class RedisClient:
 
         Should overwrite the current history with the `chat_history` argument.
         """
-        data = []
-        for message in chat_history:
-            if isinstance(message, dict):
-                data.append(message)
-            else:
-                data.append(message.dict())
-        encoded_data = json.dumps(data)
-        self._client.set(chat_id, encoded_data)
+        self._client.set(chat_id, _HISTORY_ADAPTER.dump_json(chat_history))
 
     def delete_chat_history(self, chat_id: str) -> None:
         """Delete the chat history from the Redis endpoint."""
         self._client.delete(chat_id)
 
 
-redis_client = RedisClient()
+@lru_cache(maxsize=1)
+def get_redis_client() -> RedisClient:
+    """Get the shared RedisClient, creating it on first use."""
+    return RedisClient()
@@ -4,7 +4,10 @@ It exposes a single method `read_oembed` which takes a TikTok video URL and retu
 the oembed data for the video.
 """
 import re
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from pydantic import BaseModel
 
@@ -12,6 +15,13 @@ TIK_TOK_POST_URL = "https://www.tiktok.com/@{author_name}/video/{video_id}"
 
 OEMBED_ENDPOINT = "https://www.tiktok.com/oembed?url={post_url}"
 
+# Matches the opening and closing <script> tags in the embed code
+_SCRIPT_RE = re.compile(r"<script[^>]*>|</script>", re.IGNORECASE)
+
+# A shared session keeps the connections to TikTok alive between requests
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 
 class TikTokClientError(Exception):
     """A custom exception for errors raised by the TikTokClient."""
@@ -43,7 +53,7 @@ class TikTokOembedResponse(BaseModel):
 
         # The TikTok API returns the embed code as a string with <script> tags. We
         # want to strip these tags so that we can embed the video in our own HTML.
-        self.embed_code = re.sub("<script.*?>|</script>", "", self.embed_code)
+        self.embed_code = _SCRIPT_RE.sub("", self.embed_code)
 
 
 class TikTokClient:  # pylint: disable=too-few-public-methods
@@ -67,12 +77,12 @@ class TikTokClient:  # pylint: disable=too-few-public-methods
         post_url = TIK_TOK_POST_URL.format(author_name=author_name, video_id=video_id)
         url = OEMBED_ENDPOINT.format(post_url=post_url)
 
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=5)
 
         if response.status_code != 200:
             raise TikTokClientError("Error getting oembed data")
 
-        data = response.json()
+        data = orjson.loads(response.content)
         result = TikTokOembedResponse(
             post_url=post_url,
             embed_code=data.get("html"),
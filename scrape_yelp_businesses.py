@@ -1,11 +1,15 @@
 """Scrape Yelp businesses descriptions in "scrape/searched_location_data.json" """
-import json
-import queue
+import itertools
+import mmap
 import time
 import threading
 import os
+from collections import deque
 from concurrent import futures
+from queue import SimpleQueue
+from typing import List
 
+import orjson
 
 from src import launch
 from src.utils import format_proxy
@@ -16,11 +20,27 @@ FINSIHED_FILE = "data/scrape/locations_finished.json"
 FAILED_FILE = "data/scrape/locations_failed.json"
 BASE_FILE = "data/scrape/locations.json"
 
+# The number of completed locations between saves of the results
+SAVE_EVERY = 64
+
+# The number of completed locations between status logs
+LOG_EVERY = 20
+
+# The most proxies a single request is raced across
+MAX_FAN_OUT = 3
+
+
+def load_json(filename):
+    """Parse a JSON file straight from its memory-mapped pages."""
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
 
 def read_json():
     """Reads the JSON file containing the scraped data."""
-    with open(REMAINING_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_json(REMAINING_FILE)
 
 
 class IPManager:
@@ -36,7 +56,7 @@ class IPManager:
         self._cluster = cluster
         self._success_rate = 1.0
         self._is_initializing = True
-        self._current = 0
+        self._counter = itertools.count()
         self._threshold = threshold
         self._warm_threshold = warm_threshold
         self._pool_size = len(self._cluster.ips)
@@ -45,38 +65,83 @@ class IPManager:
         # Has the warm pool been triggered?
         self._warm_pool_triggered = False
 
-        # Create a condition variable for when the Reboot has been triggered
-        self._reboot_condition = threading.Condition()
-        self._warm_pool_condition = threading.Condition()
+        # Threads queue on these locks while the warm pool fills or the cluster
+        # reboots. Nothing waits on a condition, so plain locks are enough and no
+        # wakeups need to be broadcast.
+        self._reboot_lock = threading.Lock()
+        self._warm_pool_lock = threading.Lock()
+
+        # The number of worker threads with a request in flight. The reboot and the
+        # warm pool activation wait on the idle condition until it drops to zero.
+        self._active = 0
+        self._idle = threading.Condition(self._lock)
 
-        self._thread_status = {i: False for i in range(self._pool_size)}
+        # The outcomes of raced attempts that lost. They are appended from executor
+        # callbacks, which must never block, and folded in by the next update.
+        self._late_outcomes = deque()
 
     @property
     def current(self) -> str:
         """Get the current IP and cycle the counter mod pool size"""
-        with self._lock:
-            thread_id = threading.get_ident()
+        return self.take(1)[0]
 
-            # Get the IP address and increment the counter MOD the pool size
-            ip = self._cluster.ips[self._current]
-            self._current = (self._current + 1) % self._pool_size
-
-            # Set the thread's status to active
-            self._thread_status[thread_id] = True
-            return ip
+    @property
+    def fan_out(self) -> int:
+        """The number of IPs to race each request across, based on the success rate.
+
+        While the proxies are healthy each request goes through a single IP. As the
+        success rate drops, a request is sent through more IPs at once, and the first
+        successful response is used.
+        """
+        if self._success_rate > 0.8:
+            return 1
+        if self._success_rate > 0.5:
+            return 2
+        return MAX_FAN_OUT
+
+    def take(self, count: int) -> List[str]:
+        """Get the next `count` IPs for a request, cycling the counter mod pool size.
+
+        The IPs are taken under a single acquisition of the lock, so a reboot can't
+        start while a request holds only some of the IPs it races across. The request
+        stays active until the worker that took the IPs calls `update`.
+        """
+        with self._lock:
+            # Get the IP addresses round robin, from the counter MOD the pool size
+            cluster_ips = self._cluster.ips
+            ips = [
+                cluster_ips[next(self._counter) % self._pool_size] for _ in range(count)
+            ]
+
+            # Mark the request as active
+            self._active += 1
+            return ips
+
+    def record(self, success: bool) -> None:
+        """Note the outcome of a raced attempt that lost, without blocking.
+
+        It is folded into the success rate by the next call to `update`.
+        """
+        self._late_outcomes.append(success)
+
+    def _apply_outcome(self, success: bool) -> None:
+        """Adjust the success rate with an outcome. The caller must hold the lock."""
+        if success:
+            self._is_initializing = False
+            self._success_rate = min(self._success_rate + 0.1, 1.0)
+        elif not self._is_initializing:
+            self._success_rate = max(self._success_rate - 0.1, 0)
 
     def _reboot(self):
         """Refresh the list of IPs"""
-        # A thread that has entered this method owns the reboot condition
-        # variable. This means that the thread will block all others from checking
-        # if they need to reboot until this method has completed.
-
-        # While there are True values in the _thread_status dictionary
-        while not all(not status for status in self._thread_status.values()):
-            time.sleep(1)
-
-        # Reboot logic w/ lock just for added safety
-        with self._lock:
+        # A thread that has entered this method owns the reboot lock. This means
+        # that the thread will block all others from checking if they need to reboot
+        # until this method has completed.
+
+        # Wait until no thread has a request in flight. The lock stays held through
+        # the reboot, so no thread can pick up an IP in the meantime.
+        with self._idle:
+            self._idle.wait_for(lambda: self._active == 0)
             self._cluster.reboot()
             self._success_rate = 1.0
             self._is_initializing = True
@@ -89,49 +154,45 @@ class IPManager:
 
     def _activate_warm_pool(self):
         """Activate the warm pool"""
-
-        # While there are True values in the _thread_status dictionary
-        while not all(not status for status in self._thread_status.values()):
-            time.sleep(1)
-
         # Once all the threads are inactive, activate the warm pool
-        with self._lock:
+        with self._idle:
+            self._idle.wait_for(lambda: self._active == 0)
             self._cluster.activate_warm_pool()
             self._warm_pool_triggered = False
             self._success_rate = 1.0
             self._is_initializing = True
 
     def update(self, success: bool) -> None:
-        """Update an IP with the result of a request."""
+        """Update the IPs with the result of a request.
+
+        Only the worker thread that took the IPs may call this, never an executor
+        callback, since it can block on a reboot.
+        """
         with self._lock:
-            thread_id = threading.get_ident()
-            self._thread_status[thread_id] = False
+            # Mark the request as inactive, and wake a pending reboot once all are
+            self._active -= 1
+            if self._active == 0:
+                self._idle.notify_all()
 
-            if success:
-                self._is_initializing = False
-                self._success_rate = min(self._success_rate + 0.1, 1.0)
-            else:
-                if not self._is_initializing:
-                    self._success_rate = max(self._success_rate - 0.1, 0)
+            while self._late_outcomes:
+                self._apply_outcome(self._late_outcomes.popleft())
+            self._apply_outcome(success)
 
         # If the warm pool has not been triggered and the success rate is below
         # the warm threshold, fill the warm pool.
         # Force other threads to wait for the warm pool to be filled before
         # continuing.
         # ***Threads wait here for the warm pool to be filled***
-        with self._warm_pool_condition:
+        with self._warm_pool_lock:
             if (
                 not self._warm_pool_triggered  # if the warm pool has not been triggered
                 and self._success_rate < self._warm_threshold
             ):
                 self._fill_warm_pool()
 
-                # Tell all the threads that the warm pool has been filled
-                self._warm_pool_condition.notify_all()
-
         # If the success rate is below the threshold, cycle the proxy servers.
         # ***Threads wait here for the reboot to complete***
-        with self._reboot_condition:
+        with self._reboot_lock:
             if self._success_rate < self._threshold:
                 # If we don't have a warm pool, do a full reboot
                 if not self._warm_pool_triggered:
@@ -140,9 +201,8 @@ class IPManager:
                 # Otherwise, activate the warm pool
                 else:
                     self._activate_warm_pool()
-                # At this point, we should have an active proxy server cluster
-                # Tell all threads waiting that the reboot has completed
-                self._reboot_condition.notify_all()
+                # At this point, we should have an active proxy server cluster, and
+                # the threads queued on the lock continue as it is released
 
 
 class ThreadSafeCounter:
@@ -152,10 +212,11 @@ class ThreadSafeCounter:
         self._count = 0
         self._lock = threading.Lock()
 
-    def increment(self):
-        """Increment the counter safely."""
+    def increment(self) -> int:
+        """Increment the counter safely, and return the new count."""
         with self._lock:
             self._count += 1
+            return self._count
 
     @property
     def value(self):
@@ -171,51 +232,53 @@ class DataManager:
         self._lock = threading.Lock()
 
         # Load data from files
-        self._locations = self._load_json(REMAINING_FILE)
-        self._results = self._load_json(FINSIHED_FILE)
-        self._failed = self._load_json(FAILED_FILE)
-        _base_locations = self._load_json(BASE_FILE)
+        self._locations = load_json(REMAINING_FILE)
+        self._results = load_json(FINSIHED_FILE)
+        self._failed = load_json(FAILED_FILE)
+        _base_locations = load_json(BASE_FILE)
         self._TOTAL = len(_base_locations)  # pylint: disable=invalid-name
 
         self._url_retries = {}
-        self._queue = queue.Queue()
+        self._dirty = 0
+        # The queue is only touched under self._lock, so a plain deque is enough
+        self._queue = deque(self._locations)
         self._inital_processed = len(self._results) + len(self._failed)
 
         print(len(self._locations), len(self._results), len(self._failed), self._TOTAL)
         assert self._TOTAL == len(self._locations) + self._inital_processed
 
-        for loc in self._locations:
-            self._queue.put(loc)
-        self._current = []
+        # The businesses being scraped, keyed by their ID
+        self._current = {}
 
-        self._start = time.perf_counter()
+        self._start = time.monotonic_ns()
 
-    def _load_json(self, filename):
-        with open(filename, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # Snapshots of the results are written to disk by a dedicated thread, so the
+        # workers never block on serialization or disk writes
+        self._flush_queue = SimpleQueue()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
 
     @property
     def completion(self):
         """Completion Percentage"""
-        with self._lock:
-            processed = len(self._results) + len(self._failed) - self._inital_processed
-            total = self._TOTAL - self._inital_processed
-            return round((processed / total) * 100, 3)
+        # len() of a list is atomic, so these reads don't need the lock
+        processed = len(self._results) + len(self._failed) - self._inital_processed
+        total = self._TOTAL - self._inital_processed
+        return round((processed / total) * 100, 3)
 
     @property
     def total_completion(self):
         """Total Completion Percentage"""
-        with self._lock:
-            processed = len(self._results) + len(self._failed)
-            return round((processed / self._TOTAL) * 100, 3)
+        processed = len(self._results) + len(self._failed)
+        return round((processed / self._TOTAL) * 100, 3)
 
     @property
     def next_business(self):
         """Next Location"""
         with self._lock:
-            if not self._queue.empty():
-                biz = self._queue.get()
-                self._current.append(biz)
+            if self._queue:
+                biz = self._queue.popleft()
+                self._current[biz["id"]] = biz
                 return biz
             return None
 
@@ -223,15 +286,15 @@ class DataManager:
     def complete(self):
         """Bool completion value."""
         with self._lock:
-            return self._queue.empty()
+            return not self._queue
 
     @property
-    def elapsed(self) -> float:
+    def elapsed(self) -> str:
         """The current elapsed time."""
-        elapsed_time = time.perf_counter() - self._start
-        minutes, seconds = divmod(elapsed_time, 60)
+        elapsed_seconds = (time.monotonic_ns() - self._start) // 1_000_000_000
+        minutes, seconds = divmod(elapsed_seconds, 60)
         hours, minutes = divmod(minutes, 60)
-        return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     @property
     def status(self) -> str:
@@ -241,113 +304,262 @@ class DataManager:
     @property
     def counts(self) -> str:
         """The status of the job"""
-        return f"Success: {len(self._results)} -- Failed: {len(self._failed)} -- Remaining: {len(self._locations)} || ({self._results + self._failed - self._inital_processed} / {self._TOTAL - self._inital_processed})"
+        return f"Success: {len(self._results)} -- Failed: {len(self._failed)} -- Remaining: {len(self._locations)} || ({len(self._results) + len(self._failed) - self._inital_processed} / {self._TOTAL - self._inital_processed})"
 
-    def success(self, data, ip) -> None:
-        """Update with successful result."""
+    def success(self, data, ip, log: bool = True) -> None:
+        """Update with successful result, logging it if `log` is set."""
         with self._lock:
             self._results.append(data)
+            self._dirty += 1
             # need to remove biz from current
-            self._current = [biz for biz in self._current if biz["id"] != data["id"]]
+            self._current.pop(data["id"], None)
 
         # Logging moved outside of the lock to avoid blocking
-        print(
-            f"{self.status} Successfully scraped description for {data['name']} with IP: {ip}"
-        )
+        if log:
+            print(
+                f"{self.status} Successfully scraped description for {data['name']} with IP: {ip}"
+            )
 
-    def failed(self, data, ip, exception) -> None:
-        """Update with failed result."""
+    def failed(self, data, ip, exception, log: bool = True) -> None:
+        """Update with failed result, logging it if `log` is set."""
         with self._lock:
             url = data["url"]
             self._url_retries[url] = self._url_retries.get(url, 0) + 1
             if self._url_retries[url] < 3:
-                self._queue.put(data)
+                self._queue.append(data)
             else:
                 self._failed.append(data)
+            self._dirty += 1
 
             # need to remove biz from current
-            self._current = [biz for biz in self._current if biz["id"] != data["id"]]
+            self._current.pop(data["id"], None)
 
         # Logging moved outside of the lock
-        print(
-            f"{self.status} Failure scraping description for {data['name']} with IP: {ip} - {type(exception).__name__}"
-        )
+        if log:
+            print(
+                f"{self.status} Failure scraping description for {data['name']} with IP: {ip} - {type(exception).__name__}"
+            )
+
+    def requeue_in_flight(self):
+        """Put the businesses that were being scraped back at the front of the queue,
+        e.g. after the workers were torn down mid-request.
+        """
+        with self._lock:
+            self._queue.extendleft(reversed(self._current.values()))
+            self._current.clear()
+
+    def save_results(self, wait: bool = False):
+        """Save results to a file.
+
+        The results are snapshotted under the lock and handed to the flusher thread.
+        Pass `wait=True` to block until they have been written, e.g. before exiting.
+
+        The results and failures are only ever appended to, so the snapshot records
+        their lengths, and the flusher slices them outside the lock. Only the
+        remaining locations, which are popped from, are copied under the lock.
+        """
+        with self._lock:
+            locations = [*self._current.values(), *self._queue]
+            snapshot = (locations, len(self._results), len(self._failed))
+            self._dirty = 0
+
+        written = threading.Event() if wait else None
+        self._flush_queue.put((snapshot, written))
+        if written is not None:
+            written.wait()
 
-    def save_results(self):
-        """Save results to a file."""
+    def save_results_if_dirty(self):
+        """Save results once SAVE_EVERY locations have completed since the last save."""
         with self._lock:
-            queue_copy = list(self._queue.queue)
-            locations = self._current + queue_copy
+            dirty = self._dirty >= SAVE_EVERY
+
+        if dirty:
+            self.save_results()
+
+    def _flush_loop(self):
+        """Write the snapshots queued by save_results to disk."""
+        while True:
+            snapshot, written = self._flush_queue.get()
+            waiters = [written]
+
+            # Only the newest of the queued snapshots needs to be written
+            while not self._flush_queue.empty():
+                snapshot, written = self._flush_queue.get()
+                waiters.append(written)
+
+            locations, results_count, failed_count = snapshot
             self._dump_json(locations, REMAINING_FILE)
-            self._dump_json(self._results, FINSIHED_FILE)
-            self._dump_json(self._failed, FAILED_FILE)
+            self._dump_json(self._results[:results_count], FINSIHED_FILE)
+            self._dump_json(self._failed[:failed_count], FAILED_FILE)
+
+            for written in waiters:
+                if written is not None:
+                    written.set()
 
     def _dump_json(self, data, filename):
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        # Write to a temporary file and swap it in, so an interrupted save never
+        # leaves a truncated file behind
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
 
     def log_status(self):
         """Log the current status."""
         print(f"{self.status} {self.counts}")
 
 
-def scrape_locations(ip_manager, data_manager, counter):
+def race_scrape(scrape, url, ip_manager, attempts_executor):
+    """Scrape a URL through `ip_manager.fan_out` proxies at once.
+
+    The first successful result is returned as soon as it arrives, along with the IP
+    that produced it. If every attempt fails, the last failure is returned. The
+    calling worker thread reports the outcome of the race to the IP manager, which may
+    block it on a reboot. The attempts that lost the race only record their outcome
+    once they finish, which never blocks the executor's threads.
+
+    Args:
+        scrape: The scrape function, taking the URL and the formatted proxy.
+        url: The URL to scrape.
+        ip_manager: The IP manager to take the proxies from.
+        attempts_executor: The executor, shared by all the workers, that runs the
+            concurrent attempts.
+
+    Returns:
+        The IP, the scraped result, and the exception of the attempt, if it failed.
+    """
+    ips = ip_manager.take(ip_manager.fan_out)
+    if len(ips) == 1:
+        result, failed = scrape(url, format_proxy(ips[0]))
+        ip_manager.update(not failed)
+        return ips[0], result, failed
+
+    def _record(attempt):
+        _, failed = attempt.result()
+        ip_manager.record(not failed)
+
+    attempts = {
+        attempts_executor.submit(scrape, url, format_proxy(ip)): ip for ip in ips
+    }
+
+    pending = set(attempts)
+    winner = None
+    while pending and winner is None:
+        done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+        for attempt in done:
+            ip = attempts[attempt]
+            result, failed = attempt.result()
+            if not failed and winner is None:
+                winner = (ip, result, None)
+            else:
+                ip_manager.record(not failed)
+
+    # Selenium attempts can't be cancelled, so the losing attempts run to completion
+    # in the background, and only record their outcome
+    for attempt in pending:
+        attempt.add_done_callback(_record)
+
+    if winner is not None:
+        ip_manager.update(True)
+        return winner
+
+    ip_manager.update(False)
+    return ip, result, failed
+
+
+def scrape_locations(ip_manager, data_manager, counter, attempts_executor):
     """Run the loop to scrape locations."""
     # Loop for the threads
     while True:
-        ip = ip_manager.current
         biz = data_manager.next_business
         if not biz:
             break
 
         url = biz["url"]
-        reviews, failed = scrape_business_reviews(url, format_proxy(ip))
+        ip, reviews, failed = race_scrape(
+            scrape_business_reviews, url, ip_manager, attempts_executor
+        )
+
+        # Only every LOG_EVERY-th completion is logged, so the status strings are
+        # not built for the others
+        log = counter.increment() % LOG_EVERY == 0
 
         if failed:
-            data_manager.failed(biz, ip, failed)
-            ip_manager.update(False)
+            data_manager.failed(biz, ip, failed, log=log)
 
         else:
             biz["reviews"] = reviews
-            data_manager.success(biz, ip)
-            ip_manager.update(True)
+            data_manager.success(biz, ip, log=log)
 
-        counter.increment()
-        data_manager.save_results()
+        data_manager.save_results_if_dirty()
 
-        if counter.value % 20 == 0:
+        if log:
             data_manager.log_status()
 
 
-def scrape_locations_for_page_content(ip_manager, data_manager, counter):
+def scrape_locations_for_page_content(
+    ip_manager, data_manager, counter, attempts_executor
+):
     """Run the loop to scrape locations."""
 
     while True:
-        ip = ip_manager.current
         biz = data_manager.next_business
         if not biz:
             break
 
         url = biz["url"]
 
-        content, failed = scrape_business_page_content(url, format_proxy(ip))
+        ip, content, failed = race_scrape(
+            scrape_business_page_content, url, ip_manager, attempts_executor
+        )
+
+        # Only every LOG_EVERY-th completion is logged, so the status strings are
+        # not built for the others
+        log = counter.increment() % LOG_EVERY == 0
 
         if failed:
-            data_manager.failed(biz, ip, failed)
-            ip_manager.update(False)
+            data_manager.failed(biz, ip, failed, log=log)
 
         else:
             biz["page_content"] = content
-            data_manager.success(biz, ip)
-            ip_manager.update(True)
+            data_manager.success(biz, ip, log=log)
 
-        counter.increment()
-        data_manager.save_results()
+        data_manager.save_results_if_dirty()
 
-        if counter.value % 20 == 0:
+        if log:
             data_manager.log_status()
 
 
+def scrape_once(ip_manager, data_manager, counter, num_workers):
+    """Run the worker threads until the queue is drained, re-raising the first error
+    any of them hit.
+    """
+    # The raced attempts of every worker share one pool, sized for each worker racing
+    # the largest fan out at once
+    attempts_executor = futures.ThreadPoolExecutor(
+        max_workers=num_workers * MAX_FAN_OUT
+    )
+    with attempts_executor, futures.ThreadPoolExecutor(num_workers) as executor:
+        print(f"Spinning up {num_workers} worker threads.")
+
+        _threads = [
+            executor.submit(
+                scrape_locations_for_page_content,
+                ip_manager,
+                data_manager,
+                counter,
+                attempts_executor,
+            )
+            for _ in range(num_workers)
+        ]
+        futures.wait(_threads)
+
+    for thread in _threads:
+        thread.result()
+
+
 def main():
     """Main function"""
 
@@ -359,47 +571,33 @@ def main():
     NUM_WORKERS = 10
     IPS_PER_WORKER = 2
 
-    # Read the JSON file containing the scraped data
-    cluster = launch.ProxyCluster(num=NUM_WORKERS * IPS_PER_WORKER)
-
+    # The data is loaded once and kept across restarts; only the proxy cluster is
+    # rebuilt when one of its IPs cannot be reached.
     data_manager = DataManager()
-    ip_manager = IPManager(cluster)
-
-    # Iterate until all the locations have been scraped
     counter = ThreadSafeCounter()
+    cluster = None
 
-    try:
-        with futures.ThreadPoolExecutor(max_workers=NUM_WORKERS) as executor:
-            print(f"Spinning up {NUM_WORKERS} worker threads.")
-
-            try:
-                _threads = {
-                    executor.submit(
-                        scrape_locations_for_page_content,
-                        ip_manager,
-                        data_manager,
-                        counter,
-                    )
-                    for _ in range(5)
-                }
-                futures.wait(_threads)
-            except KeyboardInterrupt:
-                data_manager.save_results()
-                os._exit(0)
-            except launch.FailedToConnectToIP:
-                print("Failed to connect to IP in cluster. Restarting script.")
-                data_manager.save_results()
-                main()
-
-    except Exception as e:  # pylint: disable=W0718
-        print(f"Error:\n{e}")
-
-    if not data_manager.complete:
-        data_manager.save_results()
+    # Iterate until all the locations have been scraped
+    while True:
+        try:
+            if cluster is None:
+                cluster = launch.ProxyCluster(num=NUM_WORKERS * IPS_PER_WORKER)
+            scrape_once(IPManager(cluster), data_manager, counter, NUM_WORKERS)
+        except KeyboardInterrupt:
+            data_manager.save_results(wait=True)
+            os._exit(0)
+        except launch.FailedToConnectToIP:
+            print("Failed to connect to IP in cluster. Restarting script.")
+            cluster = None
+        except Exception as e:  # pylint: disable=W0718
+            print(f"Error:\n{e}")
+
+        data_manager.requeue_in_flight()
+        data_manager.save_results(wait=True)
+        if data_manager.complete:
+            break
         print("Restarting Script.")
-        main()
 
-    data_manager.save_results()
     launch.terminate_cluster()
     os._exit(0)
 
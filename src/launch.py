@@ -1,11 +1,11 @@
 """Launch a proxy network to use for webscraping."""
+import asyncio
 import time
-import concurrent
-from typing import List
+from typing import Callable, List
 
 import boto3
 from botocore.exceptions import ClientError
-import requests
+import httpx
 
 from .utils import time_elapsed
 
@@ -28,6 +28,9 @@ AMI_ID = REGION_TO_AMI[REGION]
 SUBNET_ID = REGION_TO_SUBNET[REGION]
 SECURITY_GROUP_ID = SECURITY_GROUP_TO_AMI[REGION]
 
+# The URL requested through a proxy to check that it is operational
+PROBE_URL = "http://connectivitycheck.gstatic.com/generate_204"
+
 
 class FailedToConnectToIP(Exception):
     """Failed to connect to an IP address."""
@@ -50,10 +53,15 @@ def _ec2_resource() -> boto3.resource:
 
 
 def _get_ip_list(instance_ids: List[str]) -> List[str]:
-    """Get the IP addresses of the given instances."""
-    ec2 = _ec2_resource()
-    instances = ec2.instances.filter(InstanceIds=instance_ids)
-    return [instance.public_ip_address for instance in instances]
+    """Get the IP addresses of the given instances, in the order of the IDs."""
+    ec2_client = _ec2_client()
+    response = ec2_client.describe_instances(InstanceIds=instance_ids)
+    ip_addresses = {
+        instance["InstanceId"]: instance.get("PublicIpAddress")
+        for reservation in response["Reservations"]
+        for instance in reservation["Instances"]
+    }
+    return [ip_addresses[instance_id] for instance_id in instance_ids]
 
 
 def _terminate_cluster(instance_ids: List[str]) -> None:
@@ -86,23 +94,16 @@ def _launch_cluster(num: int = 10):
         request["SpotInstanceRequestId"] for request in response["SpotInstanceRequests"]
     ]
 
-    while True:
-        desc_response = ec2.describe_spot_instance_requests(
-            SpotInstanceRequestIds=spot_instance_request_ids
-        )
-        fulfilled = [
-            request["State"] == "active"
-            for request in desc_response["SpotInstanceRequests"]
-        ]
-
-        if all(fulfilled):
-            # All requests are fulfilled, break the loop
-            break
-        else:
-            # Wait for some time before checking again
-            time.sleep(5)  # for example, wait for 30 seconds
+    # Wait for all the requests to be fulfilled
+    ec2.get_waiter("spot_instance_request_fulfilled").wait(
+        SpotInstanceRequestIds=spot_instance_request_ids,
+        WaiterConfig={"Delay": 2, "MaxAttempts": 60},
+    )
 
-    # After the loop, you can retrieve the instance IDs
+    # Once the requests are fulfilled, you can retrieve the instance IDs
+    desc_response = ec2.describe_spot_instance_requests(
+        SpotInstanceRequestIds=spot_instance_request_ids
+    )
     instance_ids = [
         request["InstanceId"] for request in desc_response["SpotInstanceRequests"]
     ]
@@ -112,40 +113,61 @@ def _launch_cluster(num: int = 10):
     return instance_ids
 
 
-def _wait_for_ip(ip: str):
-    """Wait for the IP address to be operational."""
-    proxy = {"http": f"http://{ip}:8888", "https": f"http://{ip}:8888"}
+async def _wait_for_ip(ip: str) -> str:
+    """Wait for the IP address to be operational.
 
-    start = time.perf_counter()
-    curr = time.perf_counter()
-    while curr - start < 120:
-        try:
-            response = requests.get("http://google.com", proxies=proxy, timeout=5)
-            if response.status_code == 200:
-                return ip
-        except:  # pylint: disable=bare-except
-            pass
-        curr = time.perf_counter()
+    The proxy is probed with an exponential backoff, from 250ms up to 5s between
+    attempts, for up to two minutes.
+    """
+    backoff = 0.25
+    deadline = time.perf_counter() + 120
+    async with httpx.AsyncClient(proxies=f"http://{ip}:8888", timeout=3) as client:
+        while time.perf_counter() < deadline:
+            try:
+                response = await client.get(PROBE_URL)
+                if response.is_success:
+                    return ip
+            except httpx.HTTPError:
+                pass
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 1.5, 5.0)
 
     raise FailedToConnectToIP(ip)
 
 
+def _wait_for_ips(ip_addresses: List[str], on_connected: Callable[[int, str], None]):
+    """Wait for all the IP addresses to be operational, probing them concurrently.
+
+    Args:
+        ip_addresses: The IP addresses to wait for.
+        on_connected: Called with the running count and the IP address as each one
+            becomes operational.
+
+    Raises:
+        FailedToConnectToIP: If an IP address is not operational within two minutes.
+    """
+
+    async def _wait_for_all():
+        probes = [_wait_for_ip(ip) for ip in ip_addresses]
+        for count, probe in enumerate(asyncio.as_completed(probes), start=1):
+            on_connected(count, await probe)
+
+    asyncio.run(_wait_for_all())
+
+
 def await_cluster(instance_ids: List[str]):
     """Wait for the cluster of EC2 instances to be operational."""
     ip_addresses = _get_ip_list(instance_ids)
     print(f"\tAwaiting cluster of {len(ip_addresses)} instances...")
     start = time.perf_counter()
 
-    # Create a ThreadPoolExecutor
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future_to_ip = {executor.submit(_wait_for_ip, ip): ip for ip in ip_addresses}
-        count = 0
-        for future in concurrent.futures.as_completed(future_to_ip):
-            ip = future_to_ip[future]
-            count += 1
-            print(
-                f"\t[{count:02d} / {len(ip_addresses)} - {time_elapsed(start):.2f}s] Successfully connected to {ip}"
-            )
+    def _on_connected(count: int, ip: str):
+        print(
+            f"\t[{count:02d} / {len(ip_addresses)} - {time_elapsed(start):.2f}s] Successfully connected to {ip}"
+        )
+
+    _wait_for_ips(ip_addresses, _on_connected)
 
     # Otherwise, if the cluster is operational, then return the IP addresses
     print(f"\tCluster operational in {time_elapsed(start)} seconds.")
@@ -286,18 +308,12 @@ class ProxyCluster:
 
         self._log("Awaiting cluster to become active.")
 
-        # Create a ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_ip = {
-                executor.submit(_wait_for_ip, ip): ip for ip in ip_addresses
-            }
-            count = 0
-            for future in concurrent.futures.as_completed(future_to_ip):
-                ip = future_to_ip[future]
-                count += 1
-                self._log(
-                    f"({count:02d} / {len(ip_addresses):02d}) Successfully connected to {ip}"
-                )
+        def _on_connected(count: int, ip: str):
+            self._log(
+                f"({count:02d} / {len(ip_addresses):02d}) Successfully connected to {ip}"
+            )
+
+        _wait_for_ips(ip_addresses, _on_connected)
 
         # Otherwise, if the cluster is operational, then return the IP addresses
         self._log(
@@ -1,5 +1,6 @@
 """Utility functions for the project."""
 import time
+from functools import lru_cache
 
 PROXY_PORT = 8888
 
@@ -9,6 +10,7 @@ def time_elapsed(start):
     return round(time.perf_counter() - start, 2)
 
 
+@lru_cache(maxsize=128)
 def format_proxy(ip: str) -> str:
     """Formats the given IP address as a proxy."""
     return f"{ip}:{PROXY_PORT}"
@@ -27,6 +27,7 @@ class CategoryVectorstore:
             for category, embedding in zip(CATEGORIES, embeddings)
         ]
         self.vectorstore = pd.DataFrame(data)
+        self._matrix = np.asarray(embeddings, dtype=np.float32)
 
     def _embed(self, terms: List[str]) -> List[List[float]]:
         response = OpenAI().embeddings.create(
@@ -37,13 +38,9 @@ class CategoryVectorstore:
 
     def _search(self, embedding: List[float]) -> str:
         """Search for the closest category to a given embedding"""
-        vectorstore = self.vectorstore.copy()
-        vectorstore["score"] = vectorstore.embedding.apply(
-            lambda x: np.dot(x, embedding)
-        )
-        vectorstore.sort_values(by="score", ascending=False, inplace=True)
-
-        category = vectorstore.iloc[0].category
+        # Only the best match is needed, so an O(N) argmax replaces a full sort
+        scores = self._matrix @ np.asarray(embedding, dtype=np.float32)
+        category = CATEGORIES[int(np.argmax(scores))]
         return category
 
     def search_categories(self, embeddings: List[List[float]]) -> List[str]: